@@ -0,0 +1,26 @@
+"""add weekly_pattern to training_runs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0008"
+down_revision: str = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Weekday effects computed once when the run completes
+    op.add_column(
+        "training_runs",
+        sa.Column("weekly_pattern", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("training_runs", "weekly_pattern")
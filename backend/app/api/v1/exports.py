@@ -2,11 +2,12 @@
 Export routes: GET /exports/forecasts, GET /exports/summary, GET /exports/iex
 """
 import io
+import uuid
 from typing import Annotated
 
 import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.export_service import build_forecasts_excel, build_summary_excel
@@ -17,43 +18,63 @@ from app.services import channel_service, forecasting_service
 router = APIRouter()
 
 _XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+_STREAM_CHUNK = 256 * 1024
+
+
+def _stream_buffer(buf: io.BytesIO, media_type: str, filename: str) -> StreamingResponse:
+    """Send a finished export buffer in fixed-size chunks.
+
+    Response(content=buf.getvalue()) holds a second full copy of the file for
+    the body; reading the buffer in chunks keeps only one chunk extra in memory.
+    """
+    size = buf.getbuffer().nbytes
+    buf.seek(0)
+
+    def chunks():
+        while chunk := buf.read(_STREAM_CHUNK):
+            yield chunk
+
+    return StreamingResponse(
+        chunks(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(size),
+        },
+    )
 
 
 @router.get("/forecasts")
 async def export_forecasts(
     channels: Annotated[list[str] | None, Query()] = None,
+    project_id: uuid.UUID | None = None,
     db: AsyncSession = Depends(get_db),
 ):
     """Download an Excel workbook with one sheet per channel (daily forecasts)."""
     if not channels:
-        infos = await channel_service.get_channel_list(db)
+        infos = await channel_service.get_channel_list(db, project_id=project_id)
         channels = [c.name for c in infos]
-
-    channel_forecasts: dict[str, pd.DataFrame] = {}
-    for channel in channels:
-        fc = await forecasting_service.get_forecast(db, channel)
-        if fc:
-            channel_forecasts[channel] = pd.DataFrame(
-                [
-                    {
-                        "date": p.date,
-                        "yhat": p.yhat,
-                        "yhat_lower": p.yhat_lower,
-                        "yhat_upper": p.yhat_upper,
-                    }
-                    for p in fc.data
-                ]
-            )
+    channels = list(dict.fromkeys(channels))  # repeated ?channels= would be fetched twice
+
+    # One bulk fetch for every channel rather than a round trip per channel
+    forecasts = await forecasting_service.get_forecasts_bulk(db, channels, project_id=project_id)
+    # Column-wise build: no per-row dict for pandas to re-align
+    channel_forecasts: dict[str, pd.DataFrame] = {
+        channel: pd.DataFrame(
+            {
+                "date": [p.date for p in fc.data],
+                "yhat": [p.yhat for p in fc.data],
+                "yhat_lower": [p.yhat_lower for p in fc.data],
+                "yhat_upper": [p.yhat_upper for p in fc.data],
+            }
+        )
+        for channel, fc in forecasts.items()
+    }
 
     if not channel_forecasts:
         raise HTTPException(404, "No forecast data available — train models first")
 
-    excel_bytes = build_forecasts_excel(channel_forecasts)
-    return Response(
-        content=excel_bytes,
-        media_type=_XLSX_MIME,
-        headers={"Content-Disposition": "attachment; filename=forecasts.xlsx"},
-    )
+    return _stream_buffer(build_forecasts_excel(channel_forecasts), _XLSX_MIME, "forecasts.xlsx")
 
 
 @router.get("/summary")
@@ -63,11 +84,8 @@ async def export_summary(db: AsyncSession = Depends(get_db)):
     if not rows:
         raise HTTPException(404, "No summary data available — train models first")
 
-    excel_bytes = build_summary_excel([row.model_dump() for row in rows])
-    return Response(
-        content=excel_bytes,
-        media_type=_XLSX_MIME,
-        headers={"Content-Disposition": "attachment; filename=summary.xlsx"},
+    return _stream_buffer(
+        build_summary_excel([row.model_dump() for row in rows]), _XLSX_MIME, "summary.xlsx"
     )
 
 
@@ -100,8 +118,13 @@ async def export_iex(
     if not channels:
         infos = await channel_service.get_channel_list(db)
         channels = [c.name for c in infos]
+    channels = list(dict.fromkeys(channels))  # repeated ?channels= would be fetched twice
 
-    all_rows: list[dict] = []
+    # Each channel's slots are formatted column-wise and appended to the CSV
+    # buffer as they are built, so the export is never also held as row dicts
+    # and a combined DataFrame before serialisation
+    csv_buf = io.BytesIO()
+    wrote_any = False
 
     for channel in channels:
         fc = await forecasting_service.get_forecast(db, channel)
@@ -134,28 +157,25 @@ async def export_iex(
 
         # Resample to 30-min slots
         slots_df = ContactForecaster.resample_to_30min(vol_series, aht_series, hourly_weights)
+        if slots_df.empty:
+            continue
 
-        for _, row in slots_df.iterrows():
-            dt = row["ds"]
-            aht_iex = round(row["aht_seconds"] * 100) if has_aht and row["aht_seconds"] > 0 else 0
-            all_rows.append({
+        ds = slots_df["ds"]
+        aht_seconds = slots_df["aht_seconds"]
+        aht_iex = (aht_seconds * 100).round().astype(int).where(aht_seconds > 0, 0) if has_aht else 0
+        pd.DataFrame(
+            {
                 "Skill": channel,
-                "Date": dt.strftime("%m/%d/%Y"),
-                "Start Time": dt.strftime("%H:%M"),
-                "Contacts": int(row["contacts"]),
+                "Date": ds.dt.strftime("%m/%d/%Y"),
+                "Start Time": ds.dt.strftime("%H:%M"),
+                "Contacts": slots_df["contacts"].astype(int),
                 "AHT": aht_iex,
-            })
+            },
+            columns=["Skill", "Date", "Start Time", "Contacts", "AHT"],
+        ).to_csv(csv_buf, index=False, header=not wrote_any, encoding="utf-8")
+        wrote_any = True
 
-    if not all_rows:
+    if not wrote_any:
         raise HTTPException(404, "No forecast data available — train models first")
 
-    df_out = pd.DataFrame(all_rows, columns=["Skill", "Date", "Start Time", "Contacts", "AHT"])
-    csv_buf = io.StringIO()
-    df_out.to_csv(csv_buf, index=False)
-    csv_bytes = csv_buf.getvalue().encode("utf-8")
-
-    return Response(
-        content=csv_bytes,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=iex-forecast.csv"},
-    )
+    return _stream_buffer(csv_buf, "text/csv", "iex-forecast.csv")
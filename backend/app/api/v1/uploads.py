@@ -5,9 +5,10 @@ import uuid
 
 import pandas as pd
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.data_processor import DataValidationError, extract_metadata, parse_file
 from app.db.database import get_db
 from app.models.backtest_result import BacktestResult
@@ -22,6 +23,84 @@ from app.schemas.upload import DatasetOut, DatasetSummary
 router = APIRouter()
 
 ALLOWED_EXTENSIONS = (".xlsx", ".xls", ".csv")
+_READ_CHUNK = 1024 * 1024
+_INSERT_BATCH = 10_000
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an upload in 1 MB chunks, rejecting it as soon as it exceeds UPLOAD_MAX_MB.
+
+    Returns immutable bytes: BytesIO wraps a bytes object without copying it,
+    whereas wrapping a bytearray duplicates the whole upload on every read.
+    When the multipart parser already knows the size (it has spooled the file
+    to disk), the limit is checked up front and the file is read in one call,
+    so the upload is never held twice as chunks plus their join.
+    """
+    limit = settings.UPLOAD_MAX_MB * 1024 * 1024
+    if file.size is not None:
+        if file.size > limit:
+            raise HTTPException(
+                413, f"{file.filename!r} exceeds the {settings.UPLOAD_MAX_MB} MB upload limit"
+            )
+        return await file.read()
+
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := await file.read(_READ_CHUNK):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(
+                413, f"{file.filename!r} exceeds the {settings.UPLOAD_MAX_MB} MB upload limit"
+            )
+    return b"".join(chunks)
+
+
+def _nullable_floats(col: pd.Series) -> list:
+    """Column values as Python floats, with NaN mapped to None (SQL NULL)."""
+    return col.astype(float).astype(object).where(col.notna(), None).tolist()
+
+
+async def _insert_observations(
+    db: AsyncSession, dataset_id: uuid.UUID, merged: pd.DataFrame, is_hourly: bool, has_aht: bool
+) -> None:
+    """Write the merged observations for a new dataset.
+
+    Each column is converted to Python values once. On asyncpg the rows are
+    streamed with COPY on the session's own connection (same transaction, so
+    the already-flushed dataset row is visible to the foreign key); other
+    drivers fall back to batched executemany inserts. The dataset is new, so
+    rows cannot collide on uq_obs and no ON CONFLICT staging is needed.
+    """
+    n = len(merged)
+    columns = {
+        "dataset_id": [dataset_id] * n,
+        "channel": merged["Channel"].astype(str).tolist(),
+        "obs_date": merged["Date"].dt.date.tolist(),
+        "obs_hour": merged["Hour"].astype(int).tolist() if is_hourly else [None] * n,
+        "volume": merged["Volume"].astype(float).tolist(),
+        "aht": (
+            _nullable_floats(merged["AHT"]) if has_aht and "AHT" in merged.columns else [None] * n
+        ),
+        "junior_ratio": (
+            _nullable_floats(merged["Junior_Ratio"]) if "Junior_Ratio" in merged.columns else [None] * n
+        ),
+    }
+
+    conn = await db.connection()
+    if conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            ChannelObservation.__tablename__,
+            records=zip(*columns.values()),
+            columns=list(columns),
+        )
+        return
+
+    names = list(columns)
+    obs_rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+    for start in range(0, n, _INSERT_BATCH):
+        await db.execute(insert(ChannelObservation), obs_rows[start:start + _INSERT_BATCH])
 
 
 @router.post("", response_model=DatasetOut, status_code=status.HTTP_201_CREATED)
@@ -45,7 +124,7 @@ async def upload_dataset(
                 422,
                 f"{fname!r}: only {', '.join(ALLOWED_EXTENSIONS)} files are supported",
             )
-        content = await file.read()
+        content = await _read_upload(file)
         try:
             df = parse_file(content, fname)
         except DataValidationError as exc:
@@ -74,7 +153,7 @@ async def upload_dataset(
                 agg_dict["_vxaht"] = "sum"
             if "Junior_Ratio" in raw.columns:
                 agg_dict["Junior_Ratio"] = "mean"
-        merged = raw.groupby(group_cols, as_index=False).agg(agg_dict)
+        merged = raw.groupby(group_cols, as_index=False, observed=True).agg(agg_dict)
         if "_vxaht" in merged.columns:
             merged["AHT"] = merged["_vxaht"] / merged["Volume"].replace(0, float("nan"))
             merged.drop(columns=["_vxaht"], inplace=True)
@@ -105,23 +184,7 @@ async def upload_dataset(
     db.add(dataset)
     await db.flush()  # populate dataset.id
 
-    # Insert observations
-    obs_list = []
-    for _, row in merged.iterrows():
-        aht_val = float(row["AHT"]) if has_aht and "AHT" in row and pd.notna(row["AHT"]) else None
-        jr_val = float(row["Junior_Ratio"]) if "Junior_Ratio" in row and pd.notna(row.get("Junior_Ratio")) else None
-        obs_list.append(
-            ChannelObservation(
-                dataset_id=dataset.id,
-                channel=str(row["Channel"]),
-                obs_date=row["Date"].date(),
-                obs_hour=int(row["Hour"]) if is_hourly else None,
-                volume=float(row["Volume"]),
-                aht=aht_val,
-                junior_ratio=jr_val,
-            )
-        )
-    db.add_all(obs_list)
+    await _insert_observations(db, dataset.id, merged, is_hourly, has_aht)
     await db.commit()
     await db.refresh(dataset)
 
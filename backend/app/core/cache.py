@@ -0,0 +1,21 @@
+"""
+Small in-process caches shared by the service layer.
+"""
+
+
+class BoundedCache(dict):
+    """A dict that evicts its oldest entry once it holds `maxsize` items.
+
+    Insertion order is the eviction order (FIFO): entries are keyed on
+    immutable ids, so a value never goes stale and recency buys nothing.
+    Only item assignment enforces the bound; don't fill it via update().
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value) -> None:
+        if key not in self and len(self) >= self.maxsize:
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
@@ -4,6 +4,8 @@ Supports Excel (.xlsx/.xls) and CSV formats.
 Supports daily (Date/Channel/Volume) and hourly (Date/Time/Channel/Volume) layouts.
 Optional columns: AHT (seconds), Junior_Ratio (0.0–1.0) or Junior_Count (normalised to ratio).
 """
+import hashlib
+from collections import OrderedDict
 from io import BytesIO
 
 import numpy as np
@@ -18,24 +20,94 @@ _AHT_ALIASES = {"aht", "handle_time", "avg_handle_time", "average_handle_time"}
 _JUNIOR_RATIO_ALIASES = {"junior_ratio", "jr_ratio"}
 _JUNIOR_COUNT_ALIASES = {"junior_count", "jr_count", "junior", "juniors"}
 
+# Parsed frames keyed on (content digest, extension). Re-uploading the same
+# file (a retry, or the same export re-sent as actuals) skips the Excel parse.
+_PARSE_CACHE_MAX = 8
+_parse_cache: "OrderedDict[tuple[str, str], pd.DataFrame]" = OrderedDict()
+
 
 class DataValidationError(Exception):
     pass
 
 
-def _find_col(columns: list[str], aliases: set[str]) -> str | None:
+def _lower_col_map(columns) -> dict[str, str]:
+    """Lowercase name → original column name, built once per parsed frame."""
+    return {str(c).lower(): c for c in columns}
+
+
+def _find_col(col_map: dict[str, str], aliases: set[str]) -> str | None:
     """Return the first column whose lowercase name matches any alias."""
-    col_map = {c.lower(): c for c in columns}
     for alias in aliases:
         if alias in col_map:
             return col_map[alias]
     return None
 
 
+def _select_columns(df: pd.DataFrame, keep: list[str], aht_col: str | None) -> pd.DataFrame:
+    """Build the working frame from the kept columns, converted as they are taken.
+
+    Assembling a new frame from the converted Series avoids copying the raw
+    columns first (df[keep].copy()) only to overwrite most of them.
+    """
+    converted = {
+        "Date": pd.to_datetime(df["Date"], errors="coerce"),
+        "Channel": df["Channel"].astype("category"),  # int codes for the groupbys below
+        "Volume": pd.to_numeric(df["Volume"], errors="coerce"),
+    }
+    if aht_col:
+        converted[aht_col] = pd.to_numeric(df[aht_col], errors="coerce")
+    return pd.DataFrame({col: converted.get(col, df[col]) for col in keep})
+
+
+def _check_quality(df: pd.DataFrame) -> None:
+    """Reject frames with unparseable dates or volumes.
+
+    Clean files are the common case, so the gate is a cheap .any(); the
+    per-column counts for the message are only computed when it fails.
+    """
+    if df["Date"].isna().any() or df["Volume"].isna().any():
+        raise DataValidationError(
+            f"Data quality issues: {int(df['Date'].isna().sum())} unparseable dates, "
+            f"{int(df['Volume'].isna().sum())} non-numeric volumes."
+        )
+
+
+def _time_to_hour(time_col: pd.Series) -> pd.Series:
+    """Vectorised hour of day (0–23) from a Time column.
+
+    "HH:MM[:SS]" strings and time objects give their leading hour; plain numeric
+    hours (8, 8.0, "8") are truncated. Anything unparseable maps to 0.
+    """
+    if pd.api.types.is_numeric_dtype(time_col):
+        hours = np.trunc(time_col.astype(float))
+    else:
+        s = time_col.astype(str).str.strip()
+        has_colon = s.str.contains(":", regex=False)
+        head = pd.to_numeric(s.str.split(":", n=1).str[0], errors="coerce")
+        colon_hours = head.where(head % 1 == 0)  # "8.5:00" is rejected, not truncated
+        plain_hours = np.trunc(pd.to_numeric(s, errors="coerce"))
+        hours = colon_hours.where(has_colon, plain_hours)
+    return hours.fillna(0).clip(0, 23).astype(int)
+
+
 def parse_file(content: bytes, filename: str) -> pd.DataFrame:
     """Parse uploaded file bytes. Returns a clean DataFrame."""
     ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
 
+    key = (hashlib.blake2b(content, digest_size=16).hexdigest(), ext)
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return cached.copy()
+
+    df = _parse_content(content, ext)
+    _parse_cache[key] = df
+    if len(_parse_cache) > _PARSE_CACHE_MAX:
+        _parse_cache.popitem(last=False)
+    return df.copy()
+
+
+def _parse_content(content: bytes, ext: str) -> pd.DataFrame:
     if ext == "csv":
         try:
             df = pd.read_csv(BytesIO(content))
@@ -43,12 +115,9 @@ def parse_file(content: bytes, filename: str) -> pd.DataFrame:
             raise DataValidationError(f"Cannot read CSV file: {e}") from e
     else:
         try:
-            df = pd.read_excel(BytesIO(content), sheet_name="Data")
-        except Exception:
-            try:
-                df = pd.read_excel(BytesIO(content))
-            except Exception as e:
-                raise DataValidationError(f"Cannot read Excel file: {e}") from e
+            df = _read_excel(content)
+        except Exception as e:
+            raise DataValidationError(f"Cannot read Excel file: {e}") from e
 
     if "Time" in df.columns:
         missing = REQUIRED_HOURLY_COLUMNS - set(df.columns)
@@ -68,10 +137,76 @@ def parse_file(content: bytes, filename: str) -> pd.DataFrame:
         return _parse_daily(df)
 
 
+def _header_columns(header) -> list:
+    """Column names for a sheet's header row, named as pd.read_excel names them.
+
+    Blank headers become "Unnamed: <i>" and repeats get ".1", ".2", ...
+    suffixes, so every column label stays unique and df[col] is a Series.
+    """
+    columns: list = []
+    taken: set = set()
+    for i, h in enumerate(header):
+        base = f"Unnamed: {i}" if h is None or h == "" else h
+        name, n = base, 0
+        while name in taken:
+            n += 1
+            name = f"{base}.{n}"
+        taken.add(name)
+        columns.append(name)
+    return columns
+
+
+def _read_excel(content: bytes) -> pd.DataFrame:
+    """Read the "Data" sheet (or the first sheet) of an .xlsx/.xls workbook.
+
+    python-calamine parses the workbook natively, several times faster than
+    openpyxl's pure-Python XML parsing, and returns typed cells (dates as
+    date/datetime, numbers as float). pandas 2.1 has no "calamine" read_excel
+    engine, so the rows are read directly. Blank cells come back as "" and are
+    turned into missing values, and headers and whole numbers are normalised
+    as pd.read_excel would.
+    """
+    from python_calamine import CalamineWorkbook
+
+    wb = CalamineWorkbook.from_filelike(BytesIO(content))
+    sheet = "Data" if "Data" in wb.sheet_names else wb.sheet_names[0]
+    rows = wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+    if not rows:
+        return pd.DataFrame()
+    columns = _header_columns([_whole_to_int(h) for h in rows[0]])
+    records = rows[1:]
+    while records and all(v == "" for v in records[-1]):
+        records.pop()
+    df = pd.DataFrame.from_records(records, columns=columns)
+    return _restore_ints(df.mask(df.eq("")))
+
+
+def _whole_to_int(value):
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+
+def _restore_ints(df: pd.DataFrame) -> pd.DataFrame:
+    """Give whole-number cells back their int type, as pd.read_excel does.
+
+    calamine returns every number as a float, so a Channel cell holding 101
+    would otherwise become the channel "101.0" once stringified, splitting it
+    from the configs, targets and runs stored under "101".
+    """
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == float:
+            if values.notna().all() and (values % 1 == 0).all():
+                df[col] = values.astype("int64")
+        elif values.dtype == object:
+            df[col] = [_whole_to_int(v) for v in values]
+    return df
+
+
 def _parse_daily(df: pd.DataFrame) -> pd.DataFrame:
-    aht_col = _find_col(list(df.columns), _AHT_ALIASES)
-    jr_ratio_col = _find_col(list(df.columns), _JUNIOR_RATIO_ALIASES)
-    jr_count_col = _find_col(list(df.columns), _JUNIOR_COUNT_ALIASES)
+    col_map = _lower_col_map(df.columns)
+    aht_col = _find_col(col_map, _AHT_ALIASES)
+    jr_ratio_col = _find_col(col_map, _JUNIOR_RATIO_ALIASES)
+    jr_count_col = _find_col(col_map, _JUNIOR_COUNT_ALIASES)
 
     keep = ["Date", "Channel", "Volume"]
     if aht_col:
@@ -81,20 +216,9 @@ def _parse_daily(df: pd.DataFrame) -> pd.DataFrame:
     elif jr_count_col:
         keep.append(jr_count_col)
 
-    df = df[keep].copy()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df["Volume"] = pd.to_numeric(df["Volume"], errors="coerce")
-
-    if aht_col:
-        df[aht_col] = pd.to_numeric(df[aht_col], errors="coerce")
+    df = _select_columns(df, keep, aht_col)
 
-    bad_dates = df["Date"].isna().sum()
-    bad_vols = df["Volume"].isna().sum()
-    if bad_dates > 0 or bad_vols > 0:
-        raise DataValidationError(
-            f"Data quality issues: {bad_dates} unparseable dates, "
-            f"{bad_vols} non-numeric volumes."
-        )
+    _check_quality(df)
 
     # Build aggregation spec
     agg: dict = {"Volume": "sum"}
@@ -110,7 +234,7 @@ def _parse_daily(df: pd.DataFrame) -> pd.DataFrame:
         df.rename(columns={jr_count_col: "Junior_Count"}, inplace=True)
         agg["Junior_Count"] = "sum"
 
-    grouped = df.groupby(["Channel", "Date"], as_index=False).agg(agg)
+    grouped = df.groupby(["Channel", "Date"], as_index=False, observed=True).agg(agg)
 
     if aht_col:
         total_vol = grouped["Volume"].replace(0, np.nan)
@@ -119,17 +243,21 @@ def _parse_daily(df: pd.DataFrame) -> pd.DataFrame:
 
     if jr_count_col and "Junior_Count" in grouped.columns:
         # Normalise: ratio = count / max count per channel (proxy for total agents)
-        max_by_channel = grouped.groupby("Channel")["Junior_Count"].transform("max")
+        max_by_channel = grouped.groupby("Channel", observed=True)["Junior_Count"].transform("max")
         grouped["Junior_Ratio"] = (grouped["Junior_Count"] / max_by_channel.replace(0, np.nan)).clip(0, 1)
         grouped.drop(columns=["Junior_Count"], inplace=True)
 
-    return grouped.sort_values("Date").reset_index(drop=True)
+    # groupby already ordered rows by (Channel, Date); a stable argsort on the
+    # date array regroups them by date without sort_values' index handling
+    order = np.argsort(grouped["Date"].to_numpy(), kind="stable")
+    return grouped.take(order).reset_index(drop=True)
 
 
 def _parse_hourly(df: pd.DataFrame) -> pd.DataFrame:
-    aht_col = _find_col(list(df.columns), _AHT_ALIASES)
-    jr_ratio_col = _find_col(list(df.columns), _JUNIOR_RATIO_ALIASES)
-    jr_count_col = _find_col(list(df.columns), _JUNIOR_COUNT_ALIASES)
+    col_map = _lower_col_map(df.columns)
+    aht_col = _find_col(col_map, _AHT_ALIASES)
+    jr_ratio_col = _find_col(col_map, _JUNIOR_RATIO_ALIASES)
+    jr_count_col = _find_col(col_map, _JUNIOR_COUNT_ALIASES)
 
     keep = ["Date", "Time", "Channel", "Volume"]
     if aht_col:
@@ -139,36 +267,11 @@ def _parse_hourly(df: pd.DataFrame) -> pd.DataFrame:
     elif jr_count_col:
         keep.append(jr_count_col)
 
-    df = df[keep].copy()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df["Volume"] = pd.to_numeric(df["Volume"], errors="coerce")
-
-    if aht_col:
-        df[aht_col] = pd.to_numeric(df[aht_col], errors="coerce")
-
-    bad_dates = df["Date"].isna().sum()
-    bad_vols = df["Volume"].isna().sum()
-    if bad_dates > 0 or bad_vols > 0:
-        raise DataValidationError(
-            f"Data quality issues: {bad_dates} unparseable dates, "
-            f"{bad_vols} non-numeric volumes."
-        )
+    df = _select_columns(df, keep, aht_col)
 
-    def _to_hour(val) -> int:
-        if pd.isna(val):
-            return 0
-        s = str(val).strip()
-        if ":" in s:
-            try:
-                return int(s.split(":")[0])
-            except ValueError:
-                return 0
-        try:
-            return int(float(s))
-        except ValueError:
-            return 0
+    _check_quality(df)
 
-    df["Hour"] = df["Time"].apply(_to_hour).clip(0, 23)
+    df["Hour"] = _time_to_hour(df["Time"])
     df.drop(columns=["Time"], inplace=True)
 
     # Rename optional cols before groupby
@@ -191,7 +294,7 @@ def _parse_hourly(df: pd.DataFrame) -> pd.DataFrame:
     elif "Junior_Count" in df.columns:
         agg["Junior_Count"] = "sum"
 
-    grouped = df.groupby(group_cols, as_index=False).agg(agg)
+    grouped = df.groupby(group_cols, as_index=False, observed=True).agg(agg)
 
     if "AHT" in df.columns:
         total_vol = grouped["Volume"].replace(0, np.nan)
@@ -199,11 +302,12 @@ def _parse_hourly(df: pd.DataFrame) -> pd.DataFrame:
         grouped.drop(columns=["_vol_x_aht"], inplace=True)
 
     if "Junior_Count" in grouped.columns:
-        max_by_channel = grouped.groupby("Channel")["Junior_Count"].transform("max")
+        max_by_channel = grouped.groupby("Channel", observed=True)["Junior_Count"].transform("max")
         grouped["Junior_Ratio"] = (grouped["Junior_Count"] / max_by_channel.replace(0, np.nan)).clip(0, 1)
         grouped.drop(columns=["Junior_Count"], inplace=True)
 
-    return grouped.sort_values(["Date", "Hour"]).reset_index(drop=True)
+    order = np.lexsort((grouped["Hour"].to_numpy(), grouped["Date"].to_numpy()))
+    return grouped.take(order).reset_index(drop=True)
 
 
 def extract_metadata(df: pd.DataFrame) -> dict:
@@ -0,0 +1,44 @@
+"""
+Largest-Triangle-Three-Buckets (LTTB) downsampling for dense daily series.
+Keeps the visual shape of a line while cutting the number of plotted points.
+"""
+import numpy as np
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Return the indices of the `n_out` points that best preserve the shape of (x, y).
+
+    `x` must be sorted ascending and numeric (datetime64 arrays can be passed as
+    `.astype("int64")`). Indices are returned so that aligned series (e.g. the
+    lower/upper bounds of a confidence band) can be sliced with the same selection.
+    The first and last points are always kept.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # n_out - 2 interior buckets spanning points 1 … n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+
+    return idx
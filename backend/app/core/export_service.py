@@ -1,36 +1,92 @@
 """
-Build Excel export bytes from in-memory data.
+Build Excel export workbooks from in-memory data.
 """
+import re
 from io import BytesIO
 
 import pandas as pd
 
 
-def build_forecasts_excel(channel_forecasts: dict[str, pd.DataFrame]) -> bytes:
+_FORECAST_HEADERS = {
+    "date": "Date",
+    "yhat": "Forecast",
+    "yhat_lower": "Lower 95%",
+    "yhat_upper": "Upper 95%",
+}
+
+
+_SHEET_NAME_MAX = 31
+_SHEET_NAME_INVALID = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheet_names(channels) -> dict[str, str]:
+    """Map each channel to a valid, unique worksheet name, computed once up front.
+
+    Excel rejects []:*?/\\ and leading/trailing apostrophes, caps names at 31
+    characters and compares them case-insensitively, so two channels that only
+    differ past the cut-off get a numbered suffix instead of failing the export.
+    """
+    names: dict[str, str] = {}
+    taken: set[str] = set()
+    for channel in channels:
+        base = _SHEET_NAME_INVALID.sub("_", channel).strip("'")[:_SHEET_NAME_MAX] or "Sheet"
+        name, n = base, 1
+        while name.lower() in taken:
+            n += 1
+            suffix = f" ({n})"
+            name = base[: _SHEET_NAME_MAX - len(suffix)] + suffix
+        taken.add(name.lower())
+        names[channel] = name
+    return names
+
+
+def _column_values(series: pd.Series) -> list:
+    """Plain Python values for write_column; NaN becomes None so the cell stays blank."""
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+
+def build_forecasts_excel(channel_forecasts: dict[str, pd.DataFrame]) -> BytesIO:
     """
     channel_forecasts: {channel_name: DataFrame(date, yhat, yhat_lower, yhat_upper)}
-    Returns Excel file as bytes with one sheet per channel.
+    Returns the Excel file, one sheet per channel, as a buffer rewound to the start.
+
+    Written straight through xlsxwriter, one write_column call per series, which
+    skips pandas' ExcelFormatter and its per-cell dispatch.
     """
+    import xlsxwriter
+
     buf = BytesIO()
-    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
-        for channel, df in channel_forecasts.items():
-            out = df.rename(
-                columns={
-                    "date": "Date",
-                    "yhat": "Forecast",
-                    "yhat_lower": "Lower 95%",
-                    "yhat_upper": "Upper 95%",
-                }
-            )
-            sheet_name = channel[:31]  # Excel sheet name limit
-            out.to_excel(writer, sheet_name=sheet_name, index=False)
-    return buf.getvalue()
-
-
-def build_summary_excel(summary_rows: list[dict]) -> bytes:
-    """summary_rows: list of dicts matching SummaryRow schema fields."""
+    workbook = xlsxwriter.Workbook(buf, {"in_memory": True, "default_date_format": "yyyy-mm-dd"})
+    header_fmt = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+    sheet_names = _sheet_names(channel_forecasts)
+    for channel, df in channel_forecasts.items():
+        sheet = workbook.add_worksheet(sheet_names[channel])
+        sheet.write_row(0, 0, [_FORECAST_HEADERS.get(c, c) for c in df.columns], header_fmt)
+        for j, col in enumerate(df.columns):
+            sheet.write_column(1, j, _column_values(df[col]))
+    workbook.close()
+    buf.seek(0)
+    return buf
+
+
+def build_summary_excel(summary_rows: list[dict]) -> BytesIO:
+    """summary_rows: list of dicts matching SummaryRow schema fields.
+
+    A handful of rows, so the pandas formatter setup would dominate; the
+    values go straight to xlsxwriter one column at a time instead.
+    """
+    import xlsxwriter
+
     buf = BytesIO()
-    df = pd.DataFrame(summary_rows)
-    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
-        df.to_excel(writer, sheet_name="Summary", index=False)
-    return buf.getvalue()
+    workbook = xlsxwriter.Workbook(buf, {"in_memory": True})
+    header_fmt = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+    sheet = workbook.add_worksheet("Summary")
+    columns = list(summary_rows[0]) if summary_rows else []
+    sheet.write_row(0, 0, columns, header_fmt)
+    for j, col in enumerate(columns):
+        sheet.write_column(1, j, [row[col] for row in summary_rows])
+    workbook.close()
+    buf.seek(0)
+    return buf
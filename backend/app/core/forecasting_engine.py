@@ -5,21 +5,106 @@ Smart closed-day detection per channel. Bank holiday awareness.
 """
 
 import logging
+import threading
 import warnings
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-import holidays as hols_lib
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 warnings.filterwarnings("ignore")
 logging.getLogger("prophet").setLevel(logging.WARNING)
 logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
 
+logger = logging.getLogger(__name__)
+
+# Country codes offered for bank-holiday lookup (static; shared by all instances)
+_AVAILABLE_COUNTRIES = {
+    "US": "United States", "GB": "United Kingdom", "FR": "France",
+    "DE": "Germany", "ES": "Spain", "IT": "Italy", "MA": "Morocco",
+    "CA": "Canada", "AU": "Australia", "JP": "Japan", "CN": "China",
+    "IN": "India", "BR": "Brazil", "MX": "Mexico", "NL": "Netherlands",
+    "BE": "Belgium", "CH": "Switzerland", "AT": "Austria", "SE": "Sweden",
+    "NO": "Norway", "DK": "Denmark", "FI": "Finland", "PL": "Poland",
+    "PT": "Portugal", "IE": "Ireland", "NZ": "New Zealand", "SG": "Singapore",
+    "AE": "United Arab Emirates", "SA": "Saudi Arabia",
+    "ZA": "South Africa", "EG": "Egypt",
+}
+
+
+# The shared calendars grow as new years are probed, and channels fit on
+# worker threads; expanding one while another thread iterates it would raise
+_calendar_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _country_calendar(country_code: str):
+    """One holidays calendar per country per process; it memoises the years it has expanded.
+
+    Only touch it while holding _calendar_lock.
+    """
+    import holidays as hols_lib
+
+    return hols_lib.country_holidays(country_code)
+
+
+@lru_cache(maxsize=256)
+def _holiday_dates(country_code: str, start_year: int, end_year: int) -> "pd.DatetimeIndex":
+    """Sorted bank-holiday dates for a country and inclusive year range (treat as read-only).
+
+    Training, forecasting and backtesting each ask for the same ranges for
+    every channel sharing a country, so the result is computed once.
+    """
+    with _calendar_lock:
+        country_hols = _country_calendar(country_code)
+        # One membership test per year makes the calendar expand that whole
+        # year; then read its dates instead of probing all 365 days
+        for year in range(start_year, end_year + 1):
+            datetime(year, 1, 1) in country_hols  # noqa: B015
+        dates = sorted(d for d in country_hols if start_year <= d.year <= end_year)
+    # One vectorised conversion of the date objects, not a Timestamp per holiday
+    return pd.DatetimeIndex(np.array(dates, dtype="datetime64[D]").astype("datetime64[ns]"))
+
+
+def _frame_from_dates(holiday_dates) -> "pd.DataFrame | None":
+    if len(holiday_dates) == 0:
+        return None
+    return pd.DataFrame(
+        {
+            "holiday": "bank_holiday",
+            "ds": pd.DatetimeIndex(holiday_dates),
+            "lower_window": 0,
+            "upper_window": 0,
+        }
+    )
+
+
+@lru_cache(maxsize=64)
+def _holidays_frame(country_code: str, min_year: int, max_year: int) -> "pd.DataFrame | None":
+    """Prophet holidays frame for a country and year range (treat as read-only)."""
+    return _frame_from_dates(_holiday_dates(country_code, min_year, max_year))
+
+
+def _span_days(dates: "pd.Series") -> int:
+    """Whole days between the first and last timestamp, on the raw datetime64 array."""
+    arr = dates.to_numpy()
+    return int((arr.max() - arr.min()) // np.timedelta64(1, "D"))
+
 
 class ContactForecaster:
-    """Multi-channel contact volume forecasting with Prophet."""
+    """Multi-channel contact volume forecasting with Prophet.
+
+    Thread safety: one instance is shared by all channel fits of a training
+    job, which run concurrently on worker threads. This is safe under one
+    invariant: after setup (historical_data, bank_holiday_config and
+    monthly_volumes are filled before any fit starts), a fit for channel C
+    reads shared state only and writes only the C keys of models, forecasts,
+    _backtest_cache and aht_models. Distinct-key dict writes are atomic under
+    the GIL. Anything else shared and mutated during a fit (the channel
+    groups, the holiday calendars) must take its own lock. Two fits for the
+    same channel must never run at once.
+    """
 
     def __init__(self):
         self.models = {}
@@ -30,6 +115,8 @@ class ContactForecaster:
         self.monthly_volumes = {}
         self._backtest_cache: dict = {}  # channel → bt DataFrame
         self.aht_models: dict = {}       # channel → {model, last_date, has_junior}
+        self._channel_groups: tuple | None = None  # (historical_data, {channel → rows})
+        self._channel_groups_lock = threading.Lock()  # channels train on worker threads
 
     # -------------------------------------------------------------------------
     # Data loading (legacy helper kept for compatibility)
@@ -39,12 +126,29 @@ class ContactForecaster:
         try:
             df = pd.read_excel(excel_path, sheet_name=sheet_name)
             df["Date"] = pd.to_datetime(df["Date"])
+            df["Channel"] = df["Channel"].astype("category")
+            df["Volume"] = pd.to_numeric(df["Volume"], downcast="integer")
             df = df.sort_values("Date")
             self.historical_data = df
             return True, "Data loaded successfully"
         except Exception as e:
             return False, f"Error loading data: {str(e)}"
 
+    def channel_history(self, channel) -> pd.DataFrame:
+        """Rows of historical_data for one channel.
+
+        The frame is split by channel once per loaded frame, so each lookup is a
+        dict hit instead of a boolean mask over every row. Callers must not
+        mutate the returned frame in place.
+        """
+        df = self.historical_data
+        with self._channel_groups_lock:
+            groups = self._channel_groups
+            if groups is None or groups[0] is not df:
+                groups = (df, dict(iter(df.groupby("Channel", observed=True, sort=False))))
+                self._channel_groups = groups
+        return groups[1].get(channel, df.iloc[:0])
+
     # -------------------------------------------------------------------------
     # Bank holidays
     # -------------------------------------------------------------------------
@@ -54,24 +158,18 @@ class ContactForecaster:
 
     def get_bank_holidays(self, country_code, start_year, end_year):
         try:
-            country_hols = hols_lib.country_holidays(country_code)
-            out: list[pd.Timestamp] = []
-            for year in range(start_year, end_year + 1):
-                current = datetime(year, 1, 1)
-                while current.year == year:
-                    if current in country_hols:
-                        out.append(pd.Timestamp(current))
-                    current += timedelta(days=1)
-            return sorted(set(out))
-        except Exception as exc:
-            print(f"Holiday lookup failed for {country_code}: {exc}")
+            return list(_holiday_dates(country_code, int(start_year), int(end_year)))
+        except Exception:
+            logger.exception(
+                "Holiday lookup failed for %s; falling back to New Year and Christmas only",
+                country_code,
+            )
             return self._get_fallback_holidays(start_year, end_year)
 
     def _get_fallback_holidays(self, start_year, end_year):
-        out = []
-        for year in range(start_year, end_year + 1):
-            out += [pd.Timestamp(f"{year}-01-01"), pd.Timestamp(f"{year}-12-25")]
-        return out
+        # New Year's Day and Christmas for each year, parsed in one call
+        days = [f"{year}-{md}" for year in range(start_year, end_year + 1) for md in ("01-01", "12-25")]
+        return list(pd.to_datetime(days))
 
     # -------------------------------------------------------------------------
     # Monthly volume targets
@@ -79,10 +177,9 @@ class ContactForecaster:
 
     def set_monthly_volumes(self, channel, monthly_data):
         if isinstance(monthly_data, pd.DataFrame):
-            d = {}
-            for _, row in monthly_data.iterrows():
-                d[pd.to_datetime(row["Month"]).strftime("%Y-%m")] = row["Volume"]
-            self.monthly_volumes[channel] = d
+            # One vectorised parse + format for the whole column, not one per row
+            months = pd.to_datetime(monthly_data["Month"]).dt.strftime("%Y-%m")
+            self.monthly_volumes[channel] = dict(zip(months, monthly_data["Volume"]))
         else:
             self.monthly_volumes[channel] = monthly_data
 
@@ -100,21 +197,19 @@ class ContactForecaster:
             for m in range(1, 13)
         }
 
-    def _detect_closed_days(self, channel_data: pd.DataFrame) -> set[int]:
+    def _detect_closed_days(self, dates: pd.Series, volume: pd.Series) -> set[int]:
         """Return set of weekday numbers (0=Mon … 6=Sun) where channel is closed.
 
         A day is considered closed if it never appears in the data OR if its
         average volume is < 2% of the overall daily average.
         """
-        dates = pd.to_datetime(channel_data["Date"])
-        dows_present = set(dates.dt.dayofweek.unique())
+        dows = dates.dt.dayofweek
+        dows_present = set(dows.unique())
         closed = set(range(7)) - dows_present  # days never seen → always closed
 
         if dows_present:
-            cd = channel_data.copy()
-            cd["_dow"] = dates.dt.dayofweek
-            avg_by_dow = cd.groupby("_dow")["Volume"].mean()
-            overall_avg = cd["Volume"].mean()
+            avg_by_dow = volume.groupby(dows).mean()
+            overall_avg = volume.mean()
             if overall_avg > 0:
                 for dow, avg in avg_by_dow.items():
                     if avg < 0.02 * overall_avg:
@@ -122,34 +217,40 @@ class ContactForecaster:
         return closed
 
     def _build_holidays_df(self, country_code: str, min_year: int, max_year: int):
-        """Return Prophet-style holidays DataFrame or None."""
-        holiday_dates = self.get_bank_holidays(country_code, min_year, max_year)
-        if not holiday_dates:
-            return None
-        return pd.DataFrame(
-            {
-                "holiday": "bank_holiday",
-                "ds": pd.to_datetime(holiday_dates),
-                "lower_window": 0,
-                "upper_window": 0,
-            }
-        )
+        """Return Prophet-style holidays DataFrame or None.
+
+        Training and backtesting ask for the same frames for every channel that
+        shares a country; each gets its own copy of the cached frame, since
+        Prophet may write to it.
+        """
+        try:
+            frame = _holidays_frame(country_code, int(min_year), int(max_year))
+        except Exception:
+            logger.exception(
+                "Holiday lookup failed for %s; falling back to New Year and Christmas only",
+                country_code,
+            )
+            frame = _frame_from_dates(self._get_fallback_holidays(min_year, max_year))
+        return None if frame is None else frame.copy()
 
     def _apply_monthly_distribution(self, forecast: pd.DataFrame, channel: str) -> pd.DataFrame:
+        """Scale each targeted month to its client volume (in place on the forecast frame)."""
         monthly_targets = self.monthly_volumes[channel]
-        forecast = forecast.copy()
-        forecast["_month"] = forecast["ds"].dt.strftime("%Y-%m")
+        # Month of each row straight from the datetime64 buffer (no per-row strftime)
+        months = forecast["ds"].to_numpy().astype("datetime64[M]")
+        yhat = forecast["yhat"].to_numpy(dtype=np.float64)
+        factors = np.ones(len(forecast))
         for month_str, target_volume in monthly_targets.items():
-            mask = forecast["_month"] == month_str
-            if not mask.any():
-                continue
-            current_total = forecast.loc[mask, "yhat"].sum()
+            try:
+                mask = months == np.datetime64(month_str, "M")
+            except ValueError:
+                continue  # not a 'YYYY-MM' key, so it can never match a forecast month
+            current_total = yhat[mask].sum()
             if current_total > 0:
-                sf = target_volume / current_total
-                forecast.loc[mask, "yhat"] *= sf
-                forecast.loc[mask, "yhat_lower"] *= sf
-                forecast.loc[mask, "yhat_upper"] *= sf
-        return forecast.drop("_month", axis=1)
+                factors[mask] = target_volume / current_total
+        cols = ["yhat", "yhat_lower", "yhat_upper"]
+        forecast[cols] = forecast[cols].to_numpy(dtype=np.float64) * factors[:, None]
+        return forecast
 
     def _zero_closed_and_holidays(
         self,
@@ -158,22 +259,24 @@ class ContactForecaster:
         apply_holidays: bool,
         country_code: str | None,
     ) -> pd.DataFrame:
-        """Zero out forecast for closed days and bank holidays."""
-        df = forecast_df.copy()
+        """Zero out forecast for closed days and bank holidays (in place)."""
+        df = forecast_df
         cols = ["yhat", "yhat_lower", "yhat_upper"]
+        ds = df["ds"]
 
+        # One combined mask, applied to the three columns in a single write
+        mask = np.zeros(len(df), dtype=bool)
         if closed_dows:
-            mask = df["ds"].dt.dayofweek.isin(closed_dows)
-            df.loc[mask, cols] = 0.0
+            mask |= ds.dt.dayofweek.isin(closed_dows).to_numpy()
 
         if apply_holidays and country_code:
-            min_year = df["ds"].dt.year.min()
-            max_year = df["ds"].dt.year.max()
-            holiday_dates = self.get_bank_holidays(country_code, min_year, max_year)
+            years = ds.dt.year
+            holiday_dates = self.get_bank_holidays(country_code, years.min(), years.max())
             if holiday_dates:
-                mask = df["ds"].isin(holiday_dates)
-                df.loc[mask, cols] = 0.0
+                mask |= ds.isin(holiday_dates).to_numpy()
 
+        if mask.any():
+            df[cols] = np.where(mask[:, None], 0.0, df[cols].to_numpy(dtype=np.float64))
         return df
 
     # -------------------------------------------------------------------------
@@ -183,17 +286,14 @@ class ContactForecaster:
     def train_model(self, channel, custom_seasonality=True):
         from prophet import Prophet  # lazy import — cmdstan is pre-warmed in Docker
 
-        channel_data = (
-            self.historical_data[self.historical_data["Channel"] == channel]
-            .copy()
-            .sort_values("Date")
-        )
+        channel_data = self.channel_history(channel).sort_values("Date")
 
         if len(channel_data) < 30:
             return False, f"Insufficient data for {channel} (need ≥ 30 days)"
 
         # Closed-day detection (days of week where channel never operates)
-        closed_dows = self._detect_closed_days(channel_data)
+        dates = channel_data["Date"]  # datetime64 since load; no re-parse per fit
+        closed_dows = self._detect_closed_days(dates, channel_data["Volume"])
 
         # Monthly factors (stored for metadata / display only)
         ts = channel_data.set_index("Date")["Volume"].astype(float)
@@ -202,14 +302,14 @@ class ContactForecaster:
         # Prophet dataframe — strip zero-volume rows (multiplicative mode breaks on zeros)
         prophet_df = pd.DataFrame(
             {
-                "ds": pd.to_datetime(channel_data["Date"]),
+                "ds": dates,
                 "y": channel_data["Volume"].astype(float),
             }
         )
         zero_count = (prophet_df["y"] == 0).sum()
         prophet_df = prophet_df[prophet_df["y"] > 0].copy()
         if zero_count > 0:
-            print(f"  Stripped {zero_count} zero-volume rows before Prophet fit")
+            logger.info("[%s] Stripped %d zero-volume rows before Prophet fit", channel, zero_count)
 
         if len(prophet_df) < 20:
             return False, f"Insufficient non-zero data for {channel} after stripping zeros"
@@ -225,18 +325,21 @@ class ContactForecaster:
             holidays_df = self._build_holidays_df(country_code, min_year, max_year)
 
         # Decide whether to enable yearly seasonality (need ≥ 6 months)
-        date_span_days = (channel_data["Date"].max() - channel_data["Date"].min()).days
+        date_span_days = _span_days(channel_data["Date"])
         enable_yearly = date_span_days >= 180
         # For short datasets use additive mode — multiplicative needs scale data
         seasonality_mode = "multiplicative" if date_span_days >= 180 else "additive"
 
-        print(f"\n── Training: {channel} (Prophet) ──")
-        print(
-            f"  Closed days  : {[['Mon','Tue','Wed','Thu','Fri','Sat','Sun'][d] for d in sorted(closed_dows)]}"
+        # One record per fit: channels train concurrently, so separate lines would interleave
+        logger.info(
+            "[%s] Training Prophet: closed days=%s, holidays=%s, yearly=%s (%d days of data), mode=%s",
+            channel,
+            [["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][d] for d in sorted(closed_dows)],
+            country_code or "None",
+            enable_yearly,
+            date_span_days,
+            seasonality_mode,
         )
-        print(f"  Holidays     : {country_code or 'None'}")
-        print(f"  Yearly seas. : {enable_yearly}  ({date_span_days} days of data)")
-        print(f"  Mode         : {seasonality_mode}")
 
         def _build_prophet(mode: str) -> "Prophet":
             m = Prophet(
@@ -259,7 +362,9 @@ class ContactForecaster:
             model.fit(prophet_df)
         except (ValueError, RuntimeError) as exc:
             if seasonality_mode == "multiplicative":
-                print(f"  Stan convergence failed ({exc}), retrying with additive mode")
+                logger.warning(
+                    "[%s] Stan convergence failed (%s), retrying with additive mode", channel, exc
+                )
                 seasonality_mode = "additive"
                 model = _build_prophet(seasonality_mode)
                 try:
@@ -288,7 +393,7 @@ class ContactForecaster:
         }
 
         self._backtest_cache.pop(channel, None)  # invalidate old cache
-        print("  Prophet model fitted successfully.")
+        logger.info("[%s] Prophet model fitted", channel)
         return True, f"Prophet model trained for {channel}"
 
     # -------------------------------------------------------------------------
@@ -313,6 +418,7 @@ class ContactForecaster:
         try:
             future_df = pd.DataFrame({"ds": forecast_dates})
             raw = model.predict(future_df)
+            # The one copy on this path: the helpers below edit forecast_df in place
             forecast_df = raw[["ds", "yhat", "yhat_lower", "yhat_upper"]].copy()
 
             # Zero closed days + holidays
@@ -328,8 +434,8 @@ class ContactForecaster:
                 forecast_df = self._apply_monthly_distribution(forecast_df, channel)
 
             # Clip negatives
-            for col in ["yhat", "yhat_lower", "yhat_upper"]:
-                forecast_df[col] = forecast_df[col].clip(lower=0)
+            cols = ["yhat", "yhat_lower", "yhat_upper"]
+            forecast_df[cols] = forecast_df[cols].clip(lower=0)
 
             self.forecasts[channel] = forecast_df
             return forecast_df, "Forecast generated successfully"
@@ -358,13 +464,14 @@ class ContactForecaster:
             return None
 
         # Strip zeros from the prophet_df slice (same as main training)
-        prophet_df_nz = prophet_df[prophet_df["y"] > 0].copy()
+        prophet_df_nz = prophet_df[prophet_df["y"] > 0]
         if len(prophet_df_nz) <= holdout_days + 14:
             return None
 
-        train_df = prophet_df_nz.iloc[:-holdout_days].copy()
+        # Read-only slices: Prophet.fit copies its input, and the holdout is only read
+        train_df = prophet_df_nz.iloc[:-holdout_days]
         # test_df still uses original prophet_df to compare predictions against actuals
-        test_df = prophet_df.iloc[-holdout_days:].copy()
+        test_df = prophet_df.iloc[-holdout_days:]
 
         # Build holidays for the backtest period
         holidays_df = None
@@ -373,7 +480,7 @@ class ContactForecaster:
             max_year = test_df["ds"].dt.year.max() + 1
             holidays_df = self._build_holidays_df(md["country_code"], min_year, max_year)
 
-        date_span = (train_df["ds"].max() - train_df["ds"].min()).days
+        date_span = _span_days(train_df["ds"])
         enable_yearly = date_span >= 180
         enable_monthly = date_span >= 60
         bt_mode = "multiplicative" if date_span >= 180 else "additive"
@@ -413,35 +520,33 @@ class ContactForecaster:
                 closed_mask = test_df["ds"].dt.dayofweek.isin(md["closed_dows"]).values
                 preds[closed_mask] = 0.0
 
+            actual = test_df["y"].to_numpy(dtype=np.float64)
+            error_pct = np.abs(actual - preds) / np.where(actual == 0, np.nan, actual) * 100
             result = pd.DataFrame(
                 {
                     "ds": test_df["ds"].values,
-                    "actual": test_df["y"].values,
+                    "actual": actual,
                     "predicted": preds,
+                    "error_pct": error_pct,
                 }
             )
-            result["error_pct"] = (
-                np.abs(result["actual"] - result["predicted"])
-                / result["actual"].replace(0, np.nan)
-                * 100
-            )
 
             self._backtest_cache[channel] = result
             return result
 
         except Exception as exc:
-            print(f"Backtest failed for {channel}: {exc}")
+            logger.warning("[%s] Backtest failed: %s", channel, exc)
             return None
 
     def get_backtest_metrics(self, channel, holdout_days=90):
         bt = self.backtest(channel, holdout_days)
         if bt is None or len(bt) == 0:
             return None
-        actual = bt["actual"]
-        predicted = bt["predicted"]
-        mape = float(bt["error_pct"].mean())
-        mae = float(np.mean(np.abs(actual - predicted)))
-        rmse = float(np.sqrt(np.mean((actual - predicted) ** 2)))
+        # One residual array feeds both MAE and RMSE
+        err = bt["actual"].to_numpy(dtype=np.float64) - bt["predicted"].to_numpy(dtype=np.float64)
+        mape = float(bt["error_pct"].mean())  # NaN-skipping: zero-actual days are excluded
+        mae = float(np.abs(err).mean())
+        rmse = float(np.sqrt(np.dot(err, err) / len(err)))
         return {"MAPE": mape, "MAE": mae, "RMSE": rmse, "holdout_days": holdout_days}
 
     # -------------------------------------------------------------------------
@@ -467,9 +572,7 @@ class ContactForecaster:
             )
         else:
             if channel in self.forecasts:
-                fc = self.forecasts[channel].copy()
-                fc["is_actual"] = False
-                return fc
+                return self.forecasts[channel].assign(is_actual=False)
             return None
 
     # -------------------------------------------------------------------------
@@ -479,6 +582,8 @@ class ContactForecaster:
     def get_seasonality_insights(self, channel):
         if channel not in self.models:
             return None
+        from statsmodels.tsa.seasonal import seasonal_decompose
+
         ts = self.models[channel]["ts"]
         try:
             decomp = seasonal_decompose(ts, model="additive", period=7, extrapolate_trend="freq")
@@ -501,24 +606,26 @@ class ContactForecaster:
     # -------------------------------------------------------------------------
 
     def get_weekly_aggregates(self, channel, year=None):
-        cd = self.historical_data[self.historical_data["Channel"] == channel].copy()
+        cd = self.channel_history(channel)
+        years = cd["Date"].dt.year
         if year is not None:
-            cd = cd[cd["Date"].dt.year == year]
-        cd["Week"] = cd["Date"].dt.isocalendar().week
-        cd["Year"] = cd["Date"].dt.year
-        return cd.groupby(["Year", "Week"])["Volume"].sum().reset_index()
+            cd = cd[years == year]
+            years = years[cd.index]
+        # Group on key Series rather than copying the history to add columns
+        week = cd["Date"].dt.isocalendar().week.rename("Week")
+        return cd["Volume"].groupby([years.rename("Year"), week]).sum().reset_index()
 
     def compare_weeks(self, channel, week_numbers, years=None):
         if years is None:
             years = [2024, 2025, 2026]
-        rows = []
-        for year in years:
-            wd = self.get_weekly_aggregates(channel, year)
-            for week in week_numbers:
-                wdata = wd[wd["Week"] == week]
-                if not wdata.empty:
-                    rows.append({"Year": year, "Week": week, "Volume": wdata["Volume"].values[0]})
-        return pd.DataFrame(rows)
+        # One weekly aggregation for the channel, then an inner join on the
+        # requested (year, week) pairs — keeps the caller's ordering.
+        wd = self.get_weekly_aggregates(channel)
+        wd["Week"] = wd["Week"].astype(int)
+        wanted = pd.DataFrame(
+            [(year, week) for year in years for week in week_numbers], columns=["Year", "Week"]
+        )
+        return wanted.merge(wd, on=["Year", "Week"], how="inner")
 
     # -------------------------------------------------------------------------
     # AHT Model (Prophet with junior_ratio extra regressor)
@@ -535,19 +642,23 @@ class ContactForecaster:
         """
         from prophet import Prophet
 
-        df = aht_df.copy()
-        df = df[df["y"] > 0].copy()
+        df = aht_df[aht_df["y"] > 0].copy()
         if len(df) < 14:
             return False, f"Insufficient AHT data for {channel} (need ≥ 14 days with non-zero AHT)"
 
         df["junior_ratio"] = pd.to_numeric(df["junior_ratio"], errors="coerce").fillna(0.0).clip(0.0, 1.0)
         has_junior = (df["junior_ratio"] > 0).any()
 
-        date_span = (df["ds"].max() - df["ds"].min()).days
+        date_span = _span_days(df["ds"])
         enable_yearly = date_span >= 180
 
-        print(f"\n── AHT Training: {channel} ──")
-        print(f"  Rows: {len(df)}  |  yearly={enable_yearly}  |  has_junior={has_junior}")
+        logger.info(
+            "[%s] Training AHT model: rows=%d, yearly=%s, has_junior=%s",
+            channel,
+            len(df),
+            enable_yearly,
+            has_junior,
+        )
 
         model = Prophet(
             yearly_seasonality=enable_yearly,
@@ -571,7 +682,7 @@ class ContactForecaster:
             "last_date": df["ds"].max(),
             "has_junior": has_junior,
         }
-        print("  AHT Prophet model fitted successfully.")
+        logger.info("[%s] AHT Prophet model fitted", channel)
         return True, f"AHT model trained for {channel}"
 
     def generate_aht_forecast(
@@ -601,9 +712,10 @@ class ContactForecaster:
 
         if md["has_junior"]:
             if future_junior_ratios:
-                future_df["junior_ratio"] = future_df["ds"].dt.strftime("%Y-%m-%d").map(
-                    lambda d: future_junior_ratios.get(d, 0.0)
-                ).fillna(0.0)
+                # Dict-backed map (a hash lookup per date), not a Python lambda per row
+                future_df["junior_ratio"] = (
+                    future_df["ds"].dt.strftime("%Y-%m-%d").map(future_junior_ratios).fillna(0.0)
+                )
             else:
                 future_df["junior_ratio"] = 0.0
 
@@ -648,57 +760,39 @@ class ContactForecaster:
         total_w = sum(hourly_weights.values()) or 1.0
         weights = {h: w / total_w for h, w in hourly_weights.items()}
 
-        # Convert series to dict for O(1) lookup
-        vol_map = volume_series.to_dict()
-        aht_map = aht_series.to_dict() if aht_series is not None else {}
-
-        # Build adjacent-date AHT list for linear interpolation between days
-        dates = sorted(vol_map.keys())
-        aht_by_date: dict = {d: float(aht_map.get(d, 0.0) or 0.0) for d in dates}
-
-        rows = []
-        for i, date in enumerate(dates):
-            daily_vol = float(vol_map[date])
-            aht_today = aht_by_date.get(date, 0.0)
-
-            # For linear AHT interpolation: blend toward next day at end of day
-            if i < len(dates) - 1:
-                next_date = dates[i + 1]
-                aht_next = aht_by_date.get(next_date, aht_today)
-            else:
-                aht_next = aht_today
+        cols = ["ds", "contacts", "aht_seconds"]
+        vol_s = volume_series.sort_index()
+        if vol_s.empty:
+            return pd.DataFrame(columns=cols)
 
-            for hour in range(24):
-                hour_weight = weights.get(hour, 1.0 / 24)
-                hour_vol = daily_vol * hour_weight  # distributive split
-
-                # Split into two 30-min slots
-                for half in range(2):
-                    slot_dt = pd.Timestamp(date) + pd.Timedelta(hours=hour, minutes=half * 30)
-
-                    # Linear interpolation for AHT across the full day
-                    # fraction = slot index (0..47) / 48 blends today→tomorrow
-                    slot_idx = hour * 2 + half
-                    frac = slot_idx / 48.0
-                    aht_slot = aht_today * (1 - frac) + aht_next * frac if aht_today > 0 else 0.0
+        # Per-date arrays (D,) and per-hour weights (24,) — broadcast into a (D, 48) grid
+        vol = vol_s.to_numpy(dtype=np.float64)
+        aht = (
+            aht_series.reindex(vol_s.index).fillna(0.0).to_numpy(dtype=np.float64)
+            if aht_series is not None else np.zeros(len(vol))
+        )
+        hour_w = np.array([weights.get(h, 1.0 / 24) for h in range(24)])
+
+        # Distributive split: each hour's share is halved across its two 30-min slots
+        contacts = np.repeat(np.maximum(0, np.round(vol[:, None] * hour_w / 2)), 2, axis=1)
+
+        # Linear AHT interpolation across the day: slot 0..47 / 48 blends today→tomorrow
+        aht_next = np.append(aht[1:], aht[-1:])
+        frac = np.arange(48) / 48.0
+        aht_slots = np.where(
+            aht[:, None] > 0,
+            aht[:, None] * (1 - frac) + aht_next[:, None] * frac,
+            0.0,
+        )
 
-                    rows.append({
-                        "ds": slot_dt,
-                        "contacts": max(0, round(hour_vol / 2)),
-                        "aht_seconds": round(aht_slot, 2),
-                    })
+        days = pd.to_datetime(vol_s.index).to_numpy(dtype="datetime64[m]")
+        ds = days[:, None] + np.arange(0, 48 * 30, 30).astype("timedelta64[m]")
 
-        return pd.DataFrame(rows, columns=["ds", "contacts", "aht_seconds"])
+        return pd.DataFrame({
+            "ds": ds.ravel().astype("datetime64[ns]"),
+            "contacts": contacts.ravel().astype(np.int64),
+            "aht_seconds": np.round(aht_slots.ravel(), 2),
+        }, columns=cols)
 
     def get_available_countries(self):
-        return {
-            "US": "United States", "GB": "United Kingdom", "FR": "France",
-            "DE": "Germany", "ES": "Spain", "IT": "Italy", "MA": "Morocco",
-            "CA": "Canada", "AU": "Australia", "JP": "Japan", "CN": "China",
-            "IN": "India", "BR": "Brazil", "MX": "Mexico", "NL": "Netherlands",
-            "BE": "Belgium", "CH": "Switzerland", "AT": "Austria", "SE": "Sweden",
-            "NO": "Norway", "DK": "Denmark", "FI": "Finland", "PL": "Poland",
-            "PT": "Portugal", "IE": "Ireland", "NZ": "New Zealand", "SG": "Singapore",
-            "AE": "United Arab Emirates", "SA": "Saudi Arabia",
-            "ZA": "South Africa", "EG": "Egypt",
-        }
+        return _AVAILABLE_COUNTRIES
@@ -1,6 +1,7 @@
 """
 FastAPI application entry point.
 """
+import logging
 from contextlib import asynccontextmanager
 
 import sentry_sdk
@@ -12,6 +13,10 @@ from app.config import settings
 from app.db.database import AsyncSessionLocal
 from app.db.init_admin import init_admin
 
+# Training progress is logged at INFO under app.*; other libraries keep WARNING
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("app").setLevel(logging.INFO)
+
 if settings.SENTRY_DSN:
     sentry_sdk.init(dsn=settings.SENTRY_DSN, traces_sample_rate=0.2)
 
@@ -25,6 +25,7 @@ class TrainingRun(Base):
     model_config: Mapped[list | None] = mapped_column(JSONB)      # ["add","add",true]
     aic: Mapped[float | None] = mapped_column(Numeric(12, 4))
     monthly_factors: Mapped[dict | None] = mapped_column(JSONB)   # {"1":0.99,...}
+    weekly_pattern: Mapped[list | None] = mapped_column(JSONB)    # [{"day":"Monday","effect":4.2},...]
     error_message: Mapped[str | None] = mapped_column(Text)
 
     # Timestamps
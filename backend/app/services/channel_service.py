@@ -3,14 +3,19 @@ Channel service: DB queries for channel observations.
 """
 import uuid
 
-import pandas as pd
 from sqlalchemy import Integer, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import BoundedCache
 from app.models.dataset import Dataset
 from app.models.observation import ChannelObservation
 from app.schemas.channel import ChannelInfo, HourlyPoint, MonthlyObservation, ObservationPoint
 
+# Channel stats per set of active datasets. A dataset's observations never change
+# after upload, so the same active set always yields the same list; an upload,
+# deactivation or reset changes the key.
+_channel_list_cache: BoundedCache = BoundedCache(maxsize=32)
+
 
 def _active_dataset_filter(project_id: uuid.UUID | None):
     """Build the WHERE clause for active datasets, optionally scoped to a project."""
@@ -23,8 +28,18 @@ def _active_dataset_filter(project_id: uuid.UUID | None):
 async def get_channel_list(
     db, project_id: uuid.UUID | None = None
 ) -> list[ChannelInfo]:
-    """Return distinct channels with stats from active datasets."""
+    """Return distinct channels with stats from active datasets.
+
+    Every page asks for this list, and the aggregate scans every active
+    observation; the cheap dataset-id lookup decides whether it must run.
+    """
     filters = _active_dataset_filter(project_id)
+    ids_result = await db.execute(select(Dataset.id).where(*filters))
+    key = frozenset(ids_result.scalars().all())
+    cached = _channel_list_cache.get(key)
+    if cached is not None:
+        return cached
+
     result = await db.execute(
         select(
             ChannelObservation.channel,
@@ -40,7 +55,7 @@ async def get_channel_list(
         .order_by(ChannelObservation.channel)
     )
     rows = result.all()
-    return [
+    infos = [
         ChannelInfo(
             name=row.channel,
             row_count=row.row_count,
@@ -51,6 +66,8 @@ async def get_channel_list(
         )
         for row in rows
     ]
+    _channel_list_cache[key] = infos
+    return infos
 
 
 async def get_observations(
@@ -122,13 +139,14 @@ async def get_hourly_pattern(
 async def get_monthly_historical(
     db, channel: str, project_id: uuid.UUID | None = None
 ) -> list[MonthlyObservation]:
-    """Aggregate daily observations to monthly totals."""
-    obs = await get_observations(db, channel, project_id=project_id)
-    if not obs:
-        return []
-    df = pd.DataFrame([{"month": o.date.strftime("%Y-%m"), "volume": o.volume} for o in obs])
-    monthly = df.groupby("month")["volume"].sum().reset_index()
-    return [
-        MonthlyObservation(month=row["month"], total=row["volume"])
-        for _, row in monthly.iterrows()
-    ]
+    """Aggregate daily observations to monthly totals (grouped in the database)."""
+    month = func.to_char(ChannelObservation.obs_date, "YYYY-MM").label("month")
+    result = await db.execute(
+        select(month, func.sum(ChannelObservation.volume).label("total"))
+        .join(Dataset, Dataset.id == ChannelObservation.dataset_id)
+        .where(*_active_dataset_filter(project_id))
+        .where(ChannelObservation.channel == channel)
+        .group_by(month)
+        .order_by(month)
+    )
+    return [MonthlyObservation(month=row.month, total=float(row.total)) for row in result.all()]
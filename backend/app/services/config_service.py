@@ -1,7 +1,8 @@
 """
 Config service: manage holiday configs and monthly targets.
 """
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.channel_config import ChannelConfig
@@ -47,18 +48,22 @@ async def delete_holiday(db: AsyncSession, channel: str) -> bool:
 
 
 async def upsert_targets(db: AsyncSession, channel: str, targets: dict[str, float]) -> None:
-    """Upsert monthly targets for a channel."""
-    for month, volume in targets.items():
-        result = await db.execute(
-            select(MonthlyTarget)
-            .where(MonthlyTarget.channel == channel)
-            .where(MonthlyTarget.month == month)
+    """Upsert monthly targets for a channel.
+
+    A whole year of targets goes in one INSERT ... ON CONFLICT statement rather
+    than a lookup followed by one INSERT or UPDATE per month.
+    """
+    if not targets:
+        return
+    stmt = insert(MonthlyTarget).values(
+        [{"channel": channel, "month": month, "volume": volume} for month, volume in targets.items()]
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_target",
+            set_={"volume": stmt.excluded.volume, "updated_at": func.now()},
         )
-        existing = result.scalar_one_or_none()
-        if existing:
-            existing.volume = volume
-        else:
-            db.add(MonthlyTarget(channel=channel, month=month, volume=volume))
+    )
     await db.commit()
 
 
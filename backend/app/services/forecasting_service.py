@@ -3,14 +3,21 @@ Forecasting service: background training jobs and forecast/backtest retrieval.
 """
 import asyncio
 import io
+import logging
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 from fastapi import BackgroundTasks
-from sqlalchemy import select, update
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import BoundedCache
+from app.core.downsampling import lttb_indices
 from app.core.forecasting_engine import ContactForecaster
 from app.db.database import AsyncSessionLocal
 from app.models.backtest_result import BacktestResult
@@ -37,7 +44,37 @@ from app.schemas.forecast import (
 )
 from app.schemas.training import ChannelTrainingResult, TrainingJobStatus, TrainingRequest
 
+logger = logging.getLogger(__name__)
+
 _HOLDOUT_DAYS = 90
+_PDF_MAX_POINTS = 1000  # per line; an A4 page cannot resolve more
+_PDF_RASTER_DPI = 200
+_TRAIN_CONCURRENCY = os.cpu_count() or 1  # channel fits running at once, process-wide
+
+# Dedicated pool for channel fits: Stan sampling runs in a child process per
+# fit, so threads scale with cores, and fits no longer compete with other
+# to_thread work for the event loop's default executor. Shared by all jobs.
+_train_pool = ThreadPoolExecutor(max_workers=_TRAIN_CONCURRENCY, thread_name_prefix="train")
+
+# One training job at a time per process: concurrent jobs would only timeshare
+# the same cores and all finish late. Queued jobs keep their runs "pending".
+_training_lock = asyncio.Lock()
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_NEUTRAL_MONTHLY_FACTORS = {str(m): 1.0 for m in range(1, 13)}  # runs without stored factors
+
+# Summary aggregates per training run id. A run's forecasts and source
+# observations never change after it completes, so entries stay valid until
+# the run is deactivated (pruned in get_summary_rows).
+_summary_stats_cache: dict[uuid.UUID, dict] = {}
+
+# Weekday effects per training run id for runs trained before they were stored
+# on the run itself. Bounded, since this view has no natural prune point.
+_weekly_pattern_cache: BoundedCache = BoundedCache(maxsize=256)
+
+# Daily forecast payloads per training run id. The run id versions the data —
+# retraining creates a new run — so a hit skips the backtest and forecast
+# queries. Bounded like the weekday cache; each entry holds ~450 points.
+_forecast_response_cache: BoundedCache = BoundedCache(maxsize=64)
 
 
 # ---------------------------------------------------------------------------
@@ -52,7 +89,6 @@ async def start_training_job(
 ) -> uuid.UUID:
     """Create pending TrainingRun rows and enqueue the background task."""
     job_id = uuid.uuid4()
-    run_ids: dict[str, uuid.UUID] = {}
 
     # Resolve project_id from the dataset
     ds_result = await db.execute(
@@ -61,8 +97,12 @@ async def start_training_job(
     dataset = ds_result.scalar_one_or_none()
     project_id = dataset.project_id if dataset else None
 
-    for channel in request.channels:
-        run = TrainingRun(
+    # Order-preserving dedupe: a repeated channel would get a second run that
+    # the job never trains (run_ids keeps only the last one)
+    channels = list(dict.fromkeys(request.channels))
+
+    runs = [
+        TrainingRun(
             job_id=job_id,
             channel=channel,
             dataset_id=request.dataset_id,
@@ -70,9 +110,11 @@ async def start_training_job(
             status="pending",
             project_id=project_id,
         )
-        db.add(run)
-        await db.flush()  # populate run.id
-        run_ids[channel] = run.id
+        for channel in channels
+    ]
+    db.add_all(runs)
+    await db.flush()  # one batched INSERT populates every run.id
+    run_ids = {run.channel: run.id for run in runs}
 
     await db.commit()
 
@@ -80,7 +122,7 @@ async def start_training_job(
         run_training_job,
         job_id=job_id,
         dataset_id=request.dataset_id,
-        channels=list(request.channels),
+        channels=channels,
         months_ahead=request.months_ahead,
         run_ids=run_ids,
         project_id=project_id,
@@ -96,24 +138,44 @@ async def run_training_job(
     run_ids: dict[str, uuid.UUID],
     project_id: uuid.UUID | None = None,
 ) -> None:
-    """Background task: train models, persist forecasts and backtest results."""
+    """Background task: train models, persist forecasts and backtest results.
+
+    Waits for any job already training in this process before starting.
+    """
+    async with _training_lock:
+        await _train_job(job_id, dataset_id, channels, months_ahead, run_ids, project_id)
+
+
+async def _train_job(
+    job_id: uuid.UUID,
+    dataset_id: uuid.UUID,
+    channels: list[str],
+    months_ahead: int,
+    run_ids: dict[str, uuid.UUID],
+    project_id: uuid.UUID | None,
+) -> None:
     async with AsyncSessionLocal() as db:
         # 1. Load observations for the requested dataset + channels
         obs_result = await db.execute(
-            select(ChannelObservation)
+            select(
+                ChannelObservation.obs_date,
+                ChannelObservation.channel,
+                ChannelObservation.volume,
+                ChannelObservation.aht,
+                ChannelObservation.junior_ratio,
+            )
             .where(ChannelObservation.dataset_id == dataset_id)
             .where(ChannelObservation.channel.in_(channels))
             .order_by(ChannelObservation.obs_date)
         )
-        observations = obs_result.scalars().all()
+        observations = obs_result.all()
 
         if not observations:
-            for run_id in run_ids.values():
-                await db.execute(
-                    update(TrainingRun)
-                    .where(TrainingRun.id == run_id)
-                    .values(status="failed", error_message="No observations found in dataset")
-                )
+            await db.execute(
+                update(TrainingRun)
+                .where(TrainingRun.id.in_(list(run_ids.values())))
+                .values(status="failed", error_message="No observations found in dataset")
+            )
             await db.commit()
             return
 
@@ -122,33 +184,38 @@ async def run_training_job(
         dataset = ds_result.scalar_one_or_none()
         dataset_has_aht = dataset.has_aht if dataset else False
 
-        df_rows = [
+        # Built column-wise; Date becomes datetime64 once here, so per-channel
+        # slices downstream never re-parse it
+        dates, obs_channels, volumes, ahts, junior_ratios = zip(*observations)
+        df = pd.DataFrame(
             {
-                "Date": pd.Timestamp(obs.obs_date),
-                "Channel": obs.channel,
-                "Volume": float(obs.volume),
-                "AHT": float(obs.aht) if obs.aht is not None else None,
-                "Junior_Ratio": float(obs.junior_ratio) if obs.junior_ratio is not None else 0.0,
+                "Date": np.array(dates, dtype="datetime64[D]").astype("datetime64[ns]"),
+                "Channel": obs_channels,
+                "Volume": np.array(volumes, dtype=np.float64),
+                "AHT": np.array(ahts, dtype=np.float64),
+                "Junior_Ratio": np.nan_to_num(np.array(junior_ratios, dtype=np.float64)),
             }
-            for obs in observations
-        ]
-        df = pd.DataFrame(df_rows)
+        )
+        # Channel as categorical: groupby and the per-channel masks below compare int codes
+        df["Channel"] = df["Channel"].astype("category")
 
         # Volume-weighted AHT aggregation to daily
         if dataset_has_aht and "AHT" in df.columns:
             df["_vol_x_aht"] = df["Volume"] * df["AHT"].fillna(0)
             agg_extra = {"_vol_x_aht": "sum", "Junior_Ratio": "mean"}
-            daily = df.groupby(["Date", "Channel"], as_index=False).agg(
+            daily = df.groupby(["Date", "Channel"], as_index=False, observed=True).agg(
                 {"Volume": "sum", **agg_extra}
             )
             total_vol = daily["Volume"].replace(0, float("nan"))
             daily["AHT"] = daily["_vol_x_aht"] / total_vol
             daily.drop(columns=["_vol_x_aht"], inplace=True)
         else:
-            daily = df.groupby(["Date", "Channel"], as_index=False)["Volume"].sum()
+            daily = df.groupby(["Date", "Channel"], as_index=False, observed=True)["Volume"].sum()
             daily["AHT"] = None
             daily["Junior_Ratio"] = 0.0
 
+        # Daily counts are whole numbers: narrowest int dtype (stays float if not whole)
+        daily["Volume"] = pd.to_numeric(daily["Volume"], downcast="integer")
         df = daily
 
         # 2. Load holiday configs
@@ -188,22 +255,38 @@ async def run_training_job(
         for channel, targets in monthly_targets.items():
             forecaster.set_monthly_volumes(channel, targets)
 
-        # 5. Train each channel
-        for channel in channels:
-            run_id = run_ids[channel]
+        # 5. Fit channels concurrently on the shared forecaster (see the
+        #    ContactForecaster docstring for the per-channel invariant that makes
+        #    this safe); persist results one at a time as they land
+        await db.execute(
+            update(TrainingRun)
+            .where(TrainingRun.id.in_(list(run_ids.values())))
+            .values(status="running", started_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
+
+        loop = asyncio.get_running_loop()
+
+        async def fit(channel: str) -> tuple[str, dict | None, str]:
             try:
-                # Mark as running
-                await db.execute(
-                    update(TrainingRun)
-                    .where(TrainingRun.id == run_id)
-                    .values(status="running", started_at=datetime.now(timezone.utc))
+                result, msg = await loop.run_in_executor(
+                    _train_pool,
+                    _fit_channel,
+                    forecaster,
+                    channel,
+                    months_ahead,
+                    dataset_has_aht,
+                    waves_by_channel.get(channel, []),
                 )
-                await db.commit()
-
-                # Train volume model (CPU-bound)
-                success, msg = await asyncio.to_thread(forecaster.train_model, channel)
+            except Exception as exc:  # noqa: BLE001
+                result, msg = None, str(exc)
+            return channel, result, msg
 
-                if not success:
+        for next_done in asyncio.as_completed([fit(ch) for ch in channels]):
+            channel, result, msg = await next_done
+            run_id = run_ids[channel]
+            try:
+                if result is None:
                     await db.execute(
                         update(TrainingRun)
                         .where(TrainingRun.id == run_id)
@@ -216,53 +299,10 @@ async def run_training_job(
                 best_config = list(md["config"])  # tuple → list for JSONB
                 best_aic = float(md["aic"])
                 monthly_factors = {str(k): v for k, v in md["monthly_factors"].items()}
-
-                # Generate volume forecast (CPU-bound)
-                forecast_df, fmsg = await asyncio.to_thread(
-                    forecaster.generate_forecast, channel, months_ahead
-                )
-
-                if forecast_df is None:
-                    await db.execute(
-                        update(TrainingRun)
-                        .where(TrainingRun.id == run_id)
-                        .values(status="failed", error_message=fmsg)
-                    )
-                    await db.commit()
-                    continue
-
-                # Train AHT model if data is available
-                aht_forecast_df = None
-                if dataset_has_aht:
-                    ch_data = df[df["Channel"] == channel].copy()
-                    aht_data = ch_data[ch_data["AHT"].notna()][["Date", "AHT", "Junior_Ratio"]].copy()
-                    if len(aht_data) >= 14:
-                        aht_train = aht_data.rename(columns={"Date": "ds", "AHT": "y", "Junior_Ratio": "junior_ratio"})
-                        aht_ok, aht_msg = await asyncio.to_thread(
-                            forecaster.train_aht_model, channel, aht_train
-                        )
-                        if aht_ok:
-                            # Build hiring-wave junior ratios for future dates
-                            channel_waves = waves_by_channel.get(channel, [])
-                            future_ratios: dict[str, float] = {}
-                            if channel_waves and forecast_df is not None:
-                                from app.services.hiring_wave_service import build_future_junior_ratios
-                                future_ratios = build_future_junior_ratios(
-                                    channel_waves, forecast_df["ds"].tolist()
-                                )
-
-                            aht_forecast_df, _ = await asyncio.to_thread(
-                                forecaster.generate_aht_forecast,
-                                channel,
-                                months_ahead,
-                                None,
-                                future_ratios or None,
-                            )
-                            print(f"  AHT forecast generated for {channel}")
-
-                # Backtest (CPU-bound)
-                bt_df = await asyncio.to_thread(forecaster.backtest, channel, _HOLDOUT_DAYS)
-                bt_metrics = forecaster.get_backtest_metrics(channel, _HOLDOUT_DAYS)
+                forecast_df = result["forecast_df"]
+                aht_forecast_df = result["aht_forecast_df"]
+                bt_df = result["bt_df"]
+                bt_metrics = result["bt_metrics"]
 
                 # Deactivate previous active runs for this channel (same project)
                 deactivate_q = (
@@ -277,43 +317,44 @@ async def run_training_job(
                     )
                 await db.execute(deactivate_q.values(is_active=False))
 
-                # Build AHT lookup for fast join
-                aht_lookup: dict = {}
+                # Column-wise row building: one vectorised conversion per column
+                # instead of a pandas Series per row from iterrows
+                aht_vals = [None] * len(forecast_df)
                 if aht_forecast_df is not None:
-                    aht_lookup = {
-                        row["ds"].date(): float(row["aht_yhat"])
-                        for _, row in aht_forecast_df.iterrows()
-                    }
+                    aht_by_ds = aht_forecast_df.set_index("ds")["aht_yhat"].astype(float)
+                    aht_vals = _nan_to_none(forecast_df["ds"].map(aht_by_ds))
 
                 # Persist forecast rows
                 forecast_rows = [
                     Forecast(
                         training_run_id=run_id,
                         channel=channel,
-                        forecast_date=row["ds"].date(),
-                        yhat=float(row["yhat"]),
-                        yhat_lower=float(row["yhat_lower"]),
-                        yhat_upper=float(row["yhat_upper"]),
-                        aht_yhat=aht_lookup.get(row["ds"].date()),
+                        forecast_date=d,
+                        yhat=yhat,
+                        yhat_lower=lower,
+                        yhat_upper=upper,
+                        aht_yhat=aht,
+                    )
+                    for d, yhat, lower, upper, aht in zip(
+                        forecast_df["ds"].dt.date,
+                        forecast_df["yhat"].astype(float).tolist(),
+                        forecast_df["yhat_lower"].astype(float).tolist(),
+                        forecast_df["yhat_upper"].astype(float).tolist(),
+                        aht_vals,
                     )
-                    for _, row in forecast_df.iterrows()
                 ]
                 db.add_all(forecast_rows)
 
                 # Persist backtest result
                 if bt_df is not None and bt_metrics is not None:
                     bt_data = [
-                        {
-                            "date": row["ds"].strftime("%Y-%m-%d"),
-                            "actual": float(row["actual"]),
-                            "predicted": float(row["predicted"]),
-                            "error_pct": (
-                                float(row["error_pct"])
-                                if pd.notna(row["error_pct"])
-                                else None
-                            ),
-                        }
-                        for _, row in bt_df.iterrows()
+                        {"date": d, "actual": actual, "predicted": predicted, "error_pct": err}
+                        for d, actual, predicted, err in zip(
+                            bt_df["ds"].dt.strftime("%Y-%m-%d"),
+                            bt_df["actual"].astype(float).tolist(),
+                            bt_df["predicted"].astype(float).tolist(),
+                            _nan_to_none(bt_df["error_pct"]),
+                        )
                     ]
                     db.add(
                         BacktestResult(
@@ -327,6 +368,9 @@ async def run_training_job(
                         )
                     )
 
+                # Weekday effects are fixed once the run exists; store them with it
+                weekly_pattern = await _compute_weekly_pattern(db, dataset_id, channel)
+
                 # Mark training run complete and active
                 await db.execute(
                     update(TrainingRun)
@@ -337,6 +381,7 @@ async def run_training_job(
                         model_config=best_config,
                         aic=best_aic,
                         monthly_factors=monthly_factors,
+                        weekly_pattern=weekly_pattern,
                         is_active=True,
                     )
                 )
@@ -355,6 +400,63 @@ async def run_training_job(
                     pass
 
 
+def _nan_to_none(values: pd.Series) -> list:
+    """Plain floats with NaN as None, for nullable columns and JSON payloads."""
+    floats = values.astype(float)
+    return floats.astype(object).where(floats.notna(), None).tolist()
+
+
+def _fit_channel(
+    forecaster: ContactForecaster,
+    channel: str,
+    months_ahead: int,
+    dataset_has_aht: bool,
+    channel_waves: list,
+) -> tuple[dict | None, str]:
+    """CPU-bound part of one channel's training; runs in a worker thread.
+
+    Returns (results, "") on success or (None, error message) on failure.
+    """
+    success, msg = forecaster.train_model(channel)
+    if not success:
+        return None, msg
+
+    forecast_df, fmsg = forecaster.generate_forecast(channel, months_ahead)
+    if forecast_df is None:
+        return None, fmsg
+
+    # Train AHT model if data is available
+    aht_forecast_df = None
+    if dataset_has_aht:
+        ch_data = forecaster.channel_history(channel)
+        aht_data = ch_data.loc[ch_data["AHT"].notna(), ["Date", "AHT", "Junior_Ratio"]]
+        if len(aht_data) >= 14:
+            aht_train = aht_data.rename(columns={"Date": "ds", "AHT": "y", "Junior_Ratio": "junior_ratio"})
+            aht_ok, aht_msg = forecaster.train_aht_model(channel, aht_train)
+            if aht_ok:
+                # Build hiring-wave junior ratios for future dates
+                future_ratios: dict[str, float] = {}
+                if channel_waves:
+                    future_ratios = hiring_wave_service.build_future_junior_ratios(
+                        channel_waves, forecast_df["ds"].to_numpy()
+                    )
+
+                aht_forecast_df, _ = forecaster.generate_aht_forecast(
+                    channel, months_ahead, None, future_ratios or None
+                )
+                logger.info("[%s] AHT forecast generated", channel)
+
+    bt_df = forecaster.backtest(channel, _HOLDOUT_DAYS)
+    bt_metrics = forecaster.get_backtest_metrics(channel, _HOLDOUT_DAYS)
+
+    return {
+        "forecast_df": forecast_df,
+        "aht_forecast_df": aht_forecast_df,
+        "bt_df": bt_df,
+        "bt_metrics": bt_metrics,
+    }, ""
+
+
 # ---------------------------------------------------------------------------
 # Status polling
 # ---------------------------------------------------------------------------
@@ -369,15 +471,16 @@ async def get_job_status(db: AsyncSession, job_id: uuid.UUID) -> TrainingJobStat
     if not runs:
         return None
 
-    # Fetch backtest MAPEs in one query
+    # Fetch backtest MAPEs in one query — just the two columns, not the
+    # per-day holdout JSON every poll would otherwise drag along
     run_ids = [r.id for r in runs]
     bt_result = await db.execute(
-        select(BacktestResult).where(BacktestResult.training_run_id.in_(run_ids))
+        select(BacktestResult.training_run_id, BacktestResult.mape)
+        .where(BacktestResult.training_run_id.in_(run_ids))
+        .where(BacktestResult.mape.is_not(None))
     )
     mape_map: dict[uuid.UUID, float] = {
-        b.training_run_id: float(b.mape)
-        for b in bt_result.scalars().all()
-        if b.mape is not None
+        run_id: float(mape) for run_id, mape in bt_result.all()
     }
 
     results = [
@@ -435,6 +538,10 @@ async def get_forecast(
     if run is None:
         return None
 
+    cached = _forecast_response_cache.get(run.id)
+    if cached is not None:
+        return cached
+
     bt_result = await db.execute(
         select(BacktestResult).where(BacktestResult.training_run_id == run.id)
     )
@@ -448,8 +555,78 @@ async def get_forecast(
     )
     forecasts = fc_result.scalars().all()
 
+    response = _forecast_response(run, bt, forecasts)
+    _forecast_response_cache[run.id] = response
+    return response
+
+
+async def get_forecasts_bulk(
+    db: AsyncSession, channels: list[str], project_id: uuid.UUID | None = None
+) -> dict[str, ForecastResponse]:
+    """Forecasts for several channels in three queries instead of three per channel.
+
+    Scoped to a project like get_forecast, and like it, a channel with more
+    than one active run is an error rather than an arbitrary pick. Runs already
+    in the response cache are served from it; the backtests and forecast rows
+    of the rest are fetched together and grouped by run. Channels without an
+    active run are left out of the result.
+    """
+    query = (
+        select(TrainingRun)
+        .where(TrainingRun.channel.in_(channels))
+        .where(TrainingRun.is_active == True)  # noqa: E712
+    )
+    if project_id is not None:
+        query = query.where(TrainingRun.project_id == project_id)
+    run_result = await db.execute(query)
+    runs: dict[str, TrainingRun] = {}
+    for run in run_result.scalars().all():
+        if run.channel in runs:
+            raise MultipleResultsFound(f"Multiple active training runs for channel {run.channel!r}")
+        runs[run.channel] = run
+
+    responses: dict[str, ForecastResponse] = {}
+    missing: dict[uuid.UUID, TrainingRun] = {}
+    for channel, run in runs.items():
+        cached = _forecast_response_cache.get(run.id)
+        if cached is not None:
+            responses[channel] = cached
+        else:
+            missing[run.id] = run
+
+    if missing:
+        bt_result = await db.execute(
+            select(BacktestResult).where(BacktestResult.training_run_id.in_(list(missing)))
+        )
+        bts = {bt.training_run_id: bt for bt in bt_result.scalars().all()}
+
+        fc_result = await db.execute(
+            select(Forecast)
+            .where(
+                tuple_(Forecast.training_run_id, Forecast.channel).in_(
+                    [(run_id, run.channel) for run_id, run in missing.items()]
+                )
+            )
+            .order_by(Forecast.training_run_id, Forecast.forecast_date)
+        )
+        forecasts_by_run: dict[uuid.UUID, list[Forecast]] = {}
+        for f in fc_result.scalars().all():
+            forecasts_by_run.setdefault(f.training_run_id, []).append(f)
+
+        for run_id, run in missing.items():
+            response = _forecast_response(run, bts.get(run_id), forecasts_by_run.get(run_id, []))
+            _forecast_response_cache[run_id] = response
+            responses[run.channel] = response
+
+    # Keep the caller's channel order
+    return {ch: responses[ch] for ch in channels if ch in responses}
+
+
+def _forecast_response(
+    run: TrainingRun, bt: BacktestResult | None, forecasts: list[Forecast]
+) -> ForecastResponse:
     return ForecastResponse(
-        channel=channel,
+        channel=run.channel,
         model=ModelInfo(
             config=run.model_config,
             aic=float(run.aic) if run.aic is not None else None,
@@ -485,62 +662,43 @@ async def get_monthly_forecast(
     if run is None:
         return None
 
-    # Historical observations
-    obs_result = await db.execute(
-        select(ChannelObservation)
+    # Historical observations, summed per month in the database
+    obs_month = func.to_char(ChannelObservation.obs_date, "YYYY-MM").label("month")
+    hist_result = await db.execute(
+        select(obs_month, func.sum(ChannelObservation.volume).label("total"))
         .where(ChannelObservation.dataset_id == run.dataset_id)
         .where(ChannelObservation.channel == channel)
-        .order_by(ChannelObservation.obs_date)
+        .group_by(obs_month)
+        .order_by(obs_month)
     )
-    observations = obs_result.scalars().all()
-
-    historical: list[MonthlyPoint] = []
-    if observations:
-        hist_df = pd.DataFrame(
-            [{"month": o.obs_date.strftime("%Y-%m"), "volume": float(o.volume)} for o in observations]
-        )
-        hist_monthly = hist_df.groupby("month")["volume"].sum().reset_index()
-        historical = [
-            MonthlyPoint(month=row["month"], total=row["volume"])
-            for _, row in hist_monthly.iterrows()
-        ]
+    historical = [
+        MonthlyPoint(month=row.month, total=float(row.total))
+        for row in hist_result.all()
+    ]
 
-    # Forecast rows
+    # Forecast rows: one grouped pass for total/lower/upper
+    fc_month = func.to_char(Forecast.forecast_date, "YYYY-MM").label("month")
     fc_result = await db.execute(
-        select(Forecast)
+        select(
+            fc_month,
+            func.sum(func.coalesce(Forecast.yhat, 0)).label("total"),
+            func.sum(func.coalesce(Forecast.yhat_lower, 0)).label("lower"),
+            func.sum(func.coalesce(Forecast.yhat_upper, 0)).label("upper"),
+        )
         .where(Forecast.training_run_id == run.id)
         .where(Forecast.channel == channel)
-        .order_by(Forecast.forecast_date)
+        .group_by(fc_month)
+        .order_by(fc_month)
     )
-    forecasts = fc_result.scalars().all()
-
-    forecast_monthly: list[MonthlyForecastPoint] = []
-    if forecasts:
-        fc_df = pd.DataFrame(
-            [
-                {
-                    "month": f.forecast_date.strftime("%Y-%m"),
-                    "yhat": float(f.yhat or 0),
-                    "yhat_lower": float(f.yhat_lower or 0),
-                    "yhat_upper": float(f.yhat_upper or 0),
-                }
-                for f in forecasts
-            ]
+    forecast_monthly = [
+        MonthlyForecastPoint(
+            month=row.month,
+            total=float(row.total),
+            lower=float(row.lower),
+            upper=float(row.upper),
         )
-        agg = fc_df.groupby("month").agg(
-            total=("yhat", "sum"),
-            lower=("yhat_lower", "sum"),
-            upper=("yhat_upper", "sum"),
-        ).reset_index()
-        forecast_monthly = [
-            MonthlyForecastPoint(
-                month=row["month"],
-                total=row["total"],
-                lower=row["lower"],
-                upper=row["upper"],
-            )
-            for _, row in agg.iterrows()
-        ]
+        for row in fc_result.all()
+    ]
 
     return MonthlyForecastResponse(
         channel=channel,
@@ -608,35 +766,44 @@ async def get_seasonality(
     if run is None:
         return None
 
-    obs_result = await db.execute(
-        select(ChannelObservation)
-        .where(ChannelObservation.dataset_id == run.dataset_id)
+    # Stored at training time; runs trained before that fall back to the cache
+    weekly_pattern = run.weekly_pattern or _weekly_pattern_cache.get(run.id)
+    if weekly_pattern is None:
+        weekly_pattern = await _compute_weekly_pattern(db, run.dataset_id, channel)
+        _weekly_pattern_cache[run.id] = weekly_pattern
+
+    monthly_factors = run.monthly_factors or _NEUTRAL_MONTHLY_FACTORS
+    return SeasonalityResponse(
+        channel=channel,
+        monthly_factors=monthly_factors,
+        weekly_pattern=weekly_pattern,
+    )
+
+
+async def _compute_weekly_pattern(
+    db: AsyncSession, dataset_id: uuid.UUID, channel: str
+) -> list[dict]:
+    """Percentage effect of each weekday against the channel's overall daily average."""
+    # Per-weekday totals straight from the database (ISO: 1=Monday … 7=Sunday)
+    isodow = func.extract("isodow", ChannelObservation.obs_date).label("isodow")
+    dow_result = await db.execute(
+        select(isodow, func.sum(ChannelObservation.volume), func.count())
+        .where(ChannelObservation.dataset_id == dataset_id)
         .where(ChannelObservation.channel == channel)
-        .order_by(ChannelObservation.obs_date)
+        .group_by(isodow)
     )
-    observations = obs_result.scalars().all()
+    by_dow = {int(d) - 1: (float(total), n) for d, total, n in dow_result.all()}
 
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     weekly_pattern: list[dict] = []
 
-    if observations:
-        obs_df = pd.DataFrame(
-            [{"date": pd.Timestamp(o.obs_date), "volume": float(o.volume)} for o in observations]
-        )
-        obs_df["dayofweek"] = obs_df["date"].dt.dayofweek
-        daily_avg = obs_df.groupby("dayofweek")["volume"].mean()
-        overall_avg = obs_df["volume"].mean()
+    if by_dow:
+        overall_avg = sum(t for t, _ in by_dow.values()) / sum(n for _, n in by_dow.values())
         for dow in range(7):
-            avg = float(daily_avg.get(dow, overall_avg))
+            avg = by_dow[dow][0] / by_dow[dow][1] if dow in by_dow else overall_avg
             effect = ((avg / overall_avg) - 1) * 100 if overall_avg > 0 else 0.0
-            weekly_pattern.append({"day": day_names[dow], "effect": round(effect, 2)})
+            weekly_pattern.append({"day": _DAY_NAMES[dow], "effect": round(effect, 2)})
 
-    monthly_factors = run.monthly_factors or {str(m): 1.0 for m in range(1, 13)}
-    return SeasonalityResponse(
-        channel=channel,
-        monthly_factors=monthly_factors,
-        weekly_pattern=weekly_pattern,
-    )
+    return weekly_pattern
 
 
 # ---------------------------------------------------------------------------
@@ -646,54 +813,91 @@ async def get_seasonality(
 
 async def get_summary_rows(db: AsyncSession) -> list[SummaryRow]:
     """Aggregate channel-level summary from active training runs."""
+    # Only the keys the aggregates need — not the runs' JSONB columns
     runs_result = await db.execute(
-        select(TrainingRun).where(TrainingRun.is_active == True)  # noqa: E712
+        select(TrainingRun.id, TrainingRun.channel, TrainingRun.dataset_id)
+        .where(TrainingRun.is_active == True)  # noqa: E712
     )
-    runs = {r.channel: r for r in runs_result.scalars().all()}
+    runs = {r.channel: r for r in runs_result.all()}
     if not runs:
         return []
 
-    # Holiday and target presence
-    hol_result = await db.execute(select(ChannelConfig))
-    hol_channels = {c.channel for c in hol_result.scalars().all() if c.country_code}
-
-    tgt_result = await db.execute(select(MonthlyTarget))
-    tgt_channels = {t.channel for t in tgt_result.scalars().all()}
-
-    rows: list[SummaryRow] = []
-    for channel, run in sorted(runs.items()):
-        # Historical daily average
-        obs_result = await db.execute(
-            select(ChannelObservation.volume)
-            .where(ChannelObservation.dataset_id == run.dataset_id)
-            .where(ChannelObservation.channel == channel)
+    # Holiday and target presence: distinct channel names, not every config row
+    hol_result = await db.execute(
+        select(ChannelConfig.channel).where(ChannelConfig.country_code.is_not(None)).distinct()
+    )
+    hol_channels = set(hol_result.scalars().all())
+
+    tgt_result = await db.execute(select(MonthlyTarget.channel).distinct())
+    tgt_channels = set(tgt_result.scalars().all())
+
+    # Per-run aggregates are cached; only runs not seen before hit the big tables
+    missing = {ch: r for ch, r in runs.items() if r.id not in _summary_stats_cache}
+    if missing:
+        # Historical daily average for every (dataset, channel) in one grouped query
+        avg_result = await db.execute(
+            select(
+                ChannelObservation.dataset_id,
+                ChannelObservation.channel,
+                func.avg(ChannelObservation.volume),
+            )
+            .where(ChannelObservation.dataset_id.in_({r.dataset_id for r in missing.values()}))
+            .where(ChannelObservation.channel.in_(list(missing)))
+            .group_by(ChannelObservation.dataset_id, ChannelObservation.channel)
         )
-        volumes = [float(v) for v in obs_result.scalars().all()]
-        hist_avg = sum(volumes) / len(volumes) if volumes else 0.0
+        hist_avgs = {(ds_id, ch): float(avg or 0) for ds_id, ch, avg in avg_result.all()}
 
-        # Forecast rows
+        # Forecast totals per (run, month) in one grouped query; the run-level
+        # mean, total and peak/trough months all derive from these few rows
+        month = func.to_char(Forecast.forecast_date, "YYYY-MM").label("month")
         fc_result = await db.execute(
-            select(Forecast)
-            .where(Forecast.training_run_id == run.id)
-            .where(Forecast.channel == channel)
-            .order_by(Forecast.forecast_date)
+            select(
+                Forecast.training_run_id,
+                month,
+                func.sum(func.coalesce(Forecast.yhat, 0)),
+                func.count(),
+            )
+            .where(Forecast.training_run_id.in_([r.id for r in missing.values()]))
+            .group_by(Forecast.training_run_id, month)
+            .order_by(Forecast.training_run_id, month)
         )
-        fcs = fc_result.scalars().all()
-        if not fcs:
-            continue
+        monthly_by_run: dict[uuid.UUID, dict[str, tuple[float, int]]] = {}
+        for run_id, m, total, n in fc_result.all():
+            monthly_by_run.setdefault(run_id, {})[m] = (float(total), n)
+
+        for channel, run in missing.items():
+            monthly = monthly_by_run.get(run.id)
+            if not monthly:
+                continue
+
+            months = list(monthly)  # chronological (query is ordered by month)
+            sums, counts = (np.array(col) for col in zip(*monthly.values()))
+            total = float(sums.sum())
+            _summary_stats_cache[run.id] = {
+                "hist_avg": hist_avgs.get((run.dataset_id, channel), 0.0),
+                "fc_avg": total / int(counts.sum()),
+                "total": total,
+                "peak_month": months[int(sums.argmax())],
+                "trough_month": months[int(sums.argmin())],
+            }
 
-        fc_yhats = [float(f.yhat or 0) for f in fcs]
-        fc_avg = sum(fc_yhats) / len(fc_yhats) if fc_yhats else 0.0
-        total_15m = sum(fc_yhats)
-        change_pct = ((fc_avg / hist_avg) - 1) * 100 if hist_avg > 0 else 0.0
+    # Drop runs that are no longer active
+    active_ids = {r.id for r in runs.values()}
+    for run_id in [k for k in _summary_stats_cache if k not in active_ids]:
+        del _summary_stats_cache[run_id]
 
-        monthly: dict[str, float] = {}
-        for f in fcs:
-            key = f.forecast_date.strftime("%Y-%m")
-            monthly[key] = monthly.get(key, 0.0) + float(f.yhat or 0)
+    rows: list[SummaryRow] = []
+    for channel, run in sorted(runs.items()):
+        stats = _summary_stats_cache.get(run.id)
+        if stats is None:
+            continue
 
-        peak_month = max(monthly, key=lambda k: monthly[k]) if monthly else ""
-        trough_month = min(monthly, key=lambda k: monthly[k]) if monthly else ""
+        hist_avg = stats["hist_avg"]
+        fc_avg = stats["fc_avg"]
+        total_15m = stats["total"]
+        change_pct = ((fc_avg / hist_avg) - 1) * 100 if hist_avg > 0 else 0.0
+        peak_month = stats["peak_month"]
+        trough_month = stats["trough_month"]
 
         rows.append(
             SummaryRow(
@@ -784,22 +988,23 @@ async def generate_pdf_report(db: AsyncSession) -> bytes:
             run = active_runs[channel]
 
             # Load forecast data
+            # Plain column rows, not ORM objects: the charts only need the arrays
             fc_result = await db.execute(
-                select(Forecast)
+                select(Forecast.forecast_date, Forecast.yhat, Forecast.yhat_lower, Forecast.yhat_upper)
                 .where(Forecast.training_run_id == run.id)
                 .where(Forecast.channel == channel)
                 .order_by(Forecast.forecast_date)
             )
-            fcs = fc_result.scalars().all()
+            fcs = fc_result.all()
 
             # Load observations
             obs_result = await db.execute(
-                select(ChannelObservation)
+                select(ChannelObservation.obs_date, ChannelObservation.volume)
                 .where(ChannelObservation.dataset_id == run.dataset_id)
                 .where(ChannelObservation.channel == channel)
                 .order_by(ChannelObservation.obs_date)
             )
-            observations = obs_result.scalars().all()
+            observations = obs_result.all()
 
             # Load backtest
             bt_result = await db.execute(
@@ -813,19 +1018,29 @@ async def generate_pdf_report(db: AsyncSession) -> bytes:
             # Top subplot: historical + forecast
             ax_fc = axes[0]
             if observations:
-                obs_dates = [pd.Timestamp(o.obs_date) for o in observations]
-                obs_vols = [float(o.volume) for o in observations]
-                ax_fc.plot(obs_dates, obs_vols, color="#2563EB", linewidth=1.2,
+                obs_date_col, obs_vol_col = zip(*observations)
+                obs_dates = np.array(obs_date_col, dtype="datetime64[D]")
+                obs_vols = np.array(obs_vol_col, dtype=np.float64)
+                keep = lttb_indices(obs_dates.astype("int64"), obs_vols, _PDF_MAX_POINTS)
+                ax_fc.plot(obs_dates[keep], obs_vols[keep], color="#2563EB", linewidth=1.2,
                            label="Historical", alpha=0.8)
             if fcs:
-                fc_dates = [pd.Timestamp(f.forecast_date) for f in fcs]
-                fc_yhats = [float(f.yhat or 0) for f in fcs]
-                fc_lowers = [float(f.yhat_lower or 0) for f in fcs]
-                fc_uppers = [float(f.yhat_upper or 0) for f in fcs]
+                fc_dates = np.array([f[0] for f in fcs], dtype="datetime64[D]")
+                # yhat / lower / upper as one (n, 3) float array, NULLs as 0;
+                # the line and band are column views of it, no per-bound lists
+                fc_vals = np.nan_to_num(np.array([f[1:] for f in fcs], dtype=np.float64))
+                # Select on the forecast line and slice the band with the same
+                # indices so the ribbon stays aligned with it
+                keep = lttb_indices(fc_dates.astype("int64"), fc_vals[:, 0], _PDF_MAX_POINTS)
+                fc_dates, fc_vals = fc_dates[keep], fc_vals[keep]
+                fc_yhats, band = fc_vals[:, 0], fc_vals[:, 1:]
                 ax_fc.plot(fc_dates, fc_yhats, color="#F59E0B", linewidth=1.5,
                            label="Forecast")
-                ax_fc.fill_between(fc_dates, fc_lowers, fc_uppers,
-                                   color="#F59E0B", alpha=0.15, label="95% CI")
+                # Rasterize the translucent band: as vector art every PDF viewer
+                # re-composites the full polygon on each redraw
+                ax_fc.fill_between(fc_dates, band[:, 0], band[:, 1],
+                                   color="#F59E0B", alpha=0.15, label="95% CI",
+                                   rasterized=True)
             ax_fc.set_title("Daily Forecast", fontsize=10)
             ax_fc.legend(fontsize=8)
             ax_fc.tick_params(labelsize=8)
@@ -836,9 +1051,10 @@ async def generate_pdf_report(db: AsyncSession) -> bytes:
             # Bottom subplot: backtest
             ax_bt = axes[1]
             if bt and bt.data:
-                bt_dates = [pd.Timestamp(row["date"]) for row in bt.data]
-                actuals = [row["actual"] for row in bt.data]
-                predicted = [row["predicted"] for row in bt.data]
+                # ISO date strings parse straight into datetime64, no Timestamp per row
+                bt_dates = np.array([row["date"] for row in bt.data], dtype="datetime64[D]")
+                actuals = np.array([row["actual"] for row in bt.data], dtype=np.float64)
+                predicted = np.array([row["predicted"] for row in bt.data], dtype=np.float64)
                 ax_bt.plot(bt_dates, actuals, color="#2563EB", linewidth=1.2,
                            label="Actual")
                 ax_bt.plot(bt_dates, predicted, color="#EF4444", linewidth=1.2,
@@ -857,7 +1073,7 @@ async def generate_pdf_report(db: AsyncSession) -> bytes:
                 ax_bt.set_title("Backtest", fontsize=10)
 
             plt.tight_layout(rect=[0, 0, 1, 0.96])
-            pdf.savefig(fig, bbox_inches="tight")
+            pdf.savefig(fig, bbox_inches="tight", dpi=_PDF_RASTER_DPI)
             plt.close(fig)
 
     buf.seek(0)
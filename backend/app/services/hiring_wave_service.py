@@ -2,6 +2,7 @@
 import uuid
 from datetime import date
 
+import numpy as np
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -56,12 +57,17 @@ async def delete_wave(db: AsyncSession, wave_id: uuid.UUID) -> bool:
 
 
 def build_future_junior_ratios(waves: list[HiringWave], forecast_dates) -> dict[str, float]:
-    """Build {date_str: junior_ratio} mapping for forecast period from hiring waves."""
-    ratios: dict[str, float] = {}
-    for dt in forecast_dates:
-        d = dt.date() if hasattr(dt, "date") else dt
-        for wave in waves:
-            if wave.start_date <= d <= wave.end_date:
-                ratios[str(d)] = wave.junior_ratio
-                break  # first matching wave wins (they should not overlap, but safety first)
-    return ratios
+    """Build {date_str: junior_ratio} mapping for forecast period from hiring waves.
+
+    One range mask per wave over the whole date array, instead of testing every
+    wave against every date in Python.
+    """
+    days = np.asarray(forecast_dates, dtype="datetime64[D]")
+    ratios = np.zeros(len(days))
+    assigned = np.zeros(len(days), dtype=bool)
+    for wave in waves:
+        # first matching wave wins (they should not overlap, but safety first)
+        hit = ~assigned & (days >= np.datetime64(wave.start_date, "D")) & (days <= np.datetime64(wave.end_date, "D"))
+        ratios[hit] = wave.junior_ratio
+        assigned |= hit
+    return dict(zip(days[assigned].astype(str).tolist(), ratios[assigned].tolist()))
@@ -0,0 +1,48 @@
+"""
+Regression tests for upload parsing in app.core.data_processor.
+"""
+import datetime
+from io import BytesIO
+
+from openpyxl import Workbook
+
+from app.core.data_processor import parse_file
+
+
+def _xlsx(rows: list[list]) -> bytes:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in rows:
+        ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def test_numeric_channel_name_keeps_its_integer_form():
+    content = _xlsx(
+        [
+            ["Date", "Channel", "Volume"],
+            [datetime.date(2024, 1, 1), 101, 10],
+            [datetime.date(2024, 1, 2), 101, 12],
+            [datetime.date(2024, 1, 1), "Email", 5],
+        ]
+    )
+    df = parse_file(content, "numeric-channel.xlsx")
+
+    assert sorted(df["Channel"].astype(str).unique()) == ["101", "Email"]
+    assert df["Volume"].sum() == 27
+
+
+def test_repeated_header_is_suffixed_instead_of_failing():
+    content = _xlsx(
+        [
+            ["Date", "Channel", "Volume", "Volume"],
+            [datetime.date(2024, 1, 1), "Voice", 10, 99],
+            [datetime.date(2024, 1, 2), "Voice", 12, 99],
+        ]
+    )
+    df = parse_file(content, "repeated-header.xlsx")
+
+    assert df["Volume"].tolist() == [10, 12]
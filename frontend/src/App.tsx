@@ -1,4 +1,3 @@
-import { useEffect } from 'react'
 import { Navigate, Route, Routes } from 'react-router-dom'
 import AppShell from './components/layout/AppShell'
 import ProtectedRoute from './components/layout/ProtectedRoute'
@@ -9,19 +8,8 @@ import Export from './pages/Export'
 import Forecasts from './pages/Forecasts'
 import Login from './pages/Login'
 import Settings from './pages/Settings'
-import { useAppStore } from './store/useAppStore'
 
 export default function App() {
-  const theme = useAppStore((s) => s.theme)
-
-  useEffect(() => {
-    if (theme === 'dark') {
-      document.documentElement.classList.add('dark')
-    } else {
-      document.documentElement.classList.remove('dark')
-    }
-  }, [theme])
-
   return (
     <Routes>
       {/* Public */}
@@ -66,9 +66,10 @@ async function fetchBlob(url: string, filename: string) {
   URL.revokeObjectURL(href)
 }
 
-export const downloadForecasts = (channels?: string[]) => {
-  const params = channels?.map((c) => `channels=${encodeURIComponent(c)}`).join('&')
-  const url = `/exports/forecasts${params ? `?${params}` : ''}`
+export const downloadForecasts = (channels?: string[], projectId?: string | null) => {
+  const parts = channels?.map((c) => `channels=${encodeURIComponent(c)}`) ?? []
+  if (projectId) parts.push(`project_id=${encodeURIComponent(projectId)}`)
+  const url = `/exports/forecasts${parts.length ? `?${parts.join('&')}` : ''}`
   return fetchBlob(url, 'forecasts.xlsx')
 }
 
@@ -9,6 +9,7 @@ import {
   YAxis,
 } from 'recharts'
 import { useAppStore } from '../../store/useAppStore'
+import { CHART_PALETTES } from './chartTheme'
 import type { BacktestPoint } from '../../types'
 
 interface Props {
@@ -20,10 +21,13 @@ const fmt = (n: number) => n.toLocaleString(undefined, { maximumFractionDigits:
 
 export default function BacktestChart({ data, mape }: Props) {
   const theme = useAppStore((s) => s.theme)
-  const gridColor = theme === 'dark' ? '#334155' : '#E2E8F0'
-  const textColor = theme === 'dark' ? '#94A3B8' : '#64748B'
-  const tooltipBg = theme === 'dark' ? '#1E293B' : '#FFFFFF'
-  const tooltipBorder = theme === 'dark' ? '#334155' : '#E2E8F0'
+  const {
+    grid: gridColor,
+    tooltip: tooltipStyle,
+    tick: axisTick,
+    tickSmall: axisTickSmall,
+    legend: legendStyle,
+  } = CHART_PALETTES[theme]
 
   return (
     <div>
@@ -37,21 +41,16 @@ export default function BacktestChart({ data, mape }: Props) {
           <CartesianGrid strokeDasharray="3 3" stroke={gridColor} />
           <XAxis
             dataKey="date"
-            tick={{ fontSize: 10, fill: textColor }}
+            tick={axisTickSmall}
             tickFormatter={(v: string) => v.slice(5)}
             interval={13}
           />
-          <YAxis tick={{ fontSize: 11, fill: textColor }} tickFormatter={fmt} width={72} />
+          <YAxis tick={axisTick} tickFormatter={fmt} width={72} />
           <Tooltip
-            contentStyle={{
-              background: tooltipBg,
-              border: `1px solid ${tooltipBorder}`,
-              borderRadius: 8,
-              fontSize: 12,
-            }}
+            contentStyle={tooltipStyle}
             formatter={(value: number) => [fmt(value)]}
           />
-          <Legend wrapperStyle={{ fontSize: 12, color: textColor }} />
+          <Legend wrapperStyle={legendStyle} />
           <Line
             dataKey="actual"
             stroke="#059669"
@@ -1,3 +1,4 @@
+import { useMemo } from 'react'
 import {
   Area,
   CartesianGrid,
@@ -11,6 +12,8 @@ import {
   YAxis,
 } from 'recharts'
 import { useAppStore } from '../../store/useAppStore'
+import { CHART_PALETTES } from './chartTheme'
+import { lttbIndices } from './lttb'
 import type { ForecastPoint, ObservationPoint } from '../../types'
 
 interface Props {
@@ -20,47 +23,82 @@ interface Props {
 
 const fmt = (n: number) => n.toLocaleString(undefined, { maximumFractionDigits: 0 })
 
+type ChartRow = Record<string, unknown>
+
+// Multi-year histories are thinned to this many points before plotting; the
+// line keeps its shape, and the SVG stays a few thousand nodes at most
+const MAX_HISTORY_POINTS = 1500
+
+// Forecast + CI rows per forecast array. Query results keep their identity while
+// cached, so switching back to a channel reuses its rows instead of rebuilding
+// them; entries go away with the array. Re-derived when the date rolls over.
+const forecastRowsCache = new WeakMap<ForecastPoint[], { today: string; rows: ChartRow[] }>()
+
+function forecastRows(data: ForecastPoint[], todayStr: string): ChartRow[] {
+  const hit = forecastRowsCache.get(data)
+  if (hit && hit.today === todayStr) return hit.rows
+  const rows = data.map((d) => {
+    const isFuture = d.date >= todayStr
+    return {
+      date: d.date,
+      yhat: isFuture ? d.yhat : undefined,
+      yhat_gap: isFuture ? undefined : d.yhat,
+      lower: d.yhat_lower,
+      ci_band: Math.max(0, d.yhat_upper - d.yhat_lower),
+    }
+  })
+  forecastRowsCache.set(data, { today: todayStr, rows })
+  return rows
+}
+
 export default function ForecastChart({ data, historical }: Props) {
   const theme = useAppStore((s) => s.theme)
   const chartSettings = useAppStore((s) => s.chartSettings)
   const { historicalColor, forecastColor, showDataLabels, yAxisScale } = chartSettings
 
-  const gridColor = theme === 'dark' ? '#334155' : '#E2E8F0'
-  const textColor = theme === 'dark' ? '#94A3B8' : '#64748B'
-  const tooltipBg = theme === 'dark' ? '#1E293B' : '#FFFFFF'
-  const tooltipBorder = theme === 'dark' ? '#334155' : '#E2E8F0'
-  const gapColor = theme === 'dark' ? '#64748B' : '#94A3B8'
+  const {
+    grid: gridColor,
+    text: textColor,
+    tooltip: tooltipStyle,
+    tick: axisTick,
+    tooltipLabel: tooltipLabelStyle,
+    muted: gapColor,
+  } = CHART_PALETTES[theme]
   const actualsColor = '#059669'
 
   const todayStr = new Date().toISOString().slice(0, 10)
 
-  // Build merged chart array
-  const merged: Record<string, unknown>[] = []
+  // Build merged chart array — only when the series change, not on every settings tweak
+  const { merged, lastHistDate, hasActuals } = useMemo(() => {
+    const rows: ChartRow[] = []
+    let lastHist: string | null = null
+    let actuals = false
+
+    // Thin the historical line only; actuals and the forecast are plotted in full.
+    // Rows stay in date order, since actuals can sit between historical days.
+    const obs = historical ?? []
+    const histPos: number[] = []
+    obs.forEach((d, i) => {
+      if (!d.is_actuals) histPos.push(i)
+    })
+    const kept = new Set(lttbIndices(histPos.map((i) => obs[i].volume), MAX_HISTORY_POINTS).map((k) => histPos[k]))
 
-  if (historical && historical.length > 0) {
-    historical.forEach((d) => {
+    obs.forEach((d, i) => {
       if (d.is_actuals) {
-        merged.push({ date: d.date, actuals: d.volume })
+        rows.push({ date: d.date, actuals: d.volume })
+        actuals = true
       } else {
-        merged.push({ date: d.date, historical: d.volume })
+        if (kept.has(i)) rows.push({ date: d.date, historical: d.volume })
+        lastHist = d.date
       }
     })
-  }
 
-  data.forEach((d) => {
-    const isFuture = d.date >= todayStr
-    merged.push({
-      date: d.date,
-      yhat: isFuture ? d.yhat : undefined,
-      yhat_gap: isFuture ? undefined : d.yhat,
-      lower: d.yhat_lower,
-      ci_band: Math.max(0, d.yhat_upper - d.yhat_lower),
-    })
-  })
-
-  const lastHistDate = historical && historical.length > 0
-    ? historical.filter((d) => !d.is_actuals).slice(-1)[0]?.date ?? null
-    : null
+    return {
+      merged: rows.concat(forecastRows(data, todayStr)),
+      lastHistDate: lastHist as string | null,
+      hasActuals: actuals,
+    }
+  }, [data, historical, todayStr])
 
   // Determine tick interval based on total data points
   const totalPoints = merged.length
@@ -72,12 +110,12 @@ export default function ForecastChart({ data, historical }: Props) {
         <CartesianGrid strokeDasharray="3 3" stroke={gridColor} />
         <XAxis
           dataKey="date"
-          tick={{ fontSize: 11, fill: textColor }}
+          tick={axisTick}
           tickFormatter={(v: string) => v.slice(0, 7)}
           interval={tickInterval}
         />
         <YAxis
-          tick={{ fontSize: 11, fill: textColor }}
+          tick={axisTick}
           tickFormatter={fmt}
           width={72}
           scale={yAxisScale === 'log' ? 'log' : 'auto'}
@@ -85,31 +123,26 @@ export default function ForecastChart({ data, historical }: Props) {
           allowDataOverflow={yAxisScale === 'log'}
         />
         <Tooltip
-          contentStyle={{
-            background: tooltipBg,
-            border: `1px solid ${tooltipBorder}`,
-            borderRadius: 8,
-            fontSize: 12,
-          }}
-          labelStyle={{ color: textColor }}
+          contentStyle={tooltipStyle}
+          labelStyle={tooltipLabelStyle}
           formatter={(value: number, name: string) => {
             if (name === 'historical') return [fmt(value), 'Historical']
             if (name === 'actuals') return [fmt(value), 'Actuals']
             if (name === 'yhat') return [fmt(value), 'Forecast']
             if (name === 'yhat_gap') return [fmt(value), 'Gap forecast']
-            if (name === 'lower') return [fmt(value), 'Lower 95%']
-            if (name === 'ci_band') return [fmt(value), 'CI Width']
             return [fmt(value), name]
           }}
         />
 
-        {/* CI ribbon */}
+        {/* CI ribbon — decorative only: kept out of the tooltip and hover hit-testing */}
         <Area
           dataKey="lower"
           stackId="ci"
           stroke="none"
           fill="transparent"
           legendType="none"
+          tooltipType="none"
+          activeDot={false}
           isAnimationActive={false}
         />
         <Area
@@ -119,6 +152,8 @@ export default function ForecastChart({ data, historical }: Props) {
           fill={forecastColor}
           fillOpacity={0.18}
           legendType="none"
+          tooltipType="none"
+          activeDot={false}
           isAnimationActive={false}
         />
 
@@ -138,7 +173,7 @@ export default function ForecastChart({ data, historical }: Props) {
         )}
 
         {/* Actuals line (uploaded actuals for gap period) */}
-        {historical && historical.some((d) => d.is_actuals) && (
+        {hasActuals && (
           <Line
             dataKey="actuals"
             stroke={actualsColor}
@@ -1,3 +1,4 @@
+import { useMemo } from 'react'
 import {
   Bar,
   BarChart,
@@ -9,6 +10,7 @@ import {
   YAxis,
 } from 'recharts'
 import { useAppStore } from '../../store/useAppStore'
+import { CHART_PALETTES } from './chartTheme'
 import type { MonthlyForecastPoint, MonthlyPoint } from '../../types'
 
 interface Props {
@@ -18,40 +20,42 @@ interface Props {
 
 const fmt = (n: number) => n.toLocaleString(undefined, { maximumFractionDigits: 0 })
 
+interface MonthRow { month: string; Historical: number | null; Forecast: number | null }
+
 export default function MonthlyChart({ historical, forecast }: Props) {
   const theme = useAppStore((s) => s.theme)
-  const gridColor = theme === 'dark' ? '#334155' : '#E2E8F0'
-  const textColor = theme === 'dark' ? '#94A3B8' : '#64748B'
-  const tooltipBg = theme === 'dark' ? '#1E293B' : '#FFFFFF'
-  const tooltipBorder = theme === 'dark' ? '#334155' : '#E2E8F0'
-
-  // Merge historical + forecast into one array keyed by month
-  const allMonths = Array.from(
-    new Set([...historical.map((h) => h.month), ...forecast.map((f) => f.month)])
-  ).sort()
+  const {
+    grid: gridColor,
+    tooltip: tooltipStyle,
+    tick: axisTick,
+    tickSmall: axisTickSmall,
+    legend: legendStyle,
+  } = CHART_PALETTES[theme]
 
-  const chartData = allMonths.map((month) => ({
-    month,
-    Historical: historical.find((h) => h.month === month)?.total ?? null,
-    Forecast: forecast.find((f) => f.month === month)?.total ?? null,
-  }))
+  // Merge historical + forecast into one array keyed by month: one pass over
+  // each series into a Map, instead of a linear find per month per series
+  const chartData = useMemo(() => {
+    const rows = new Map<string, MonthRow>()
+    for (const h of historical) rows.set(h.month, { month: h.month, Historical: h.total, Forecast: null })
+    for (const f of forecast) {
+      const row = rows.get(f.month)
+      if (row) row.Forecast = f.total
+      else rows.set(f.month, { month: f.month, Historical: null, Forecast: f.total })
+    }
+    return [...rows.values()].sort((a, b) => (a.month < b.month ? -1 : a.month > b.month ? 1 : 0))
+  }, [historical, forecast])
 
   return (
     <ResponsiveContainer width="100%" height={360}>
       <BarChart data={chartData} margin={{ top: 10, right: 20, left: 0, bottom: 0 }}>
         <CartesianGrid strokeDasharray="3 3" stroke={gridColor} />
-        <XAxis dataKey="month" tick={{ fontSize: 10, fill: textColor }} interval={1} />
-        <YAxis tick={{ fontSize: 11, fill: textColor }} tickFormatter={fmt} width={72} />
+        <XAxis dataKey="month" tick={axisTickSmall} interval={1} />
+        <YAxis tick={axisTick} tickFormatter={fmt} width={72} />
         <Tooltip
-          contentStyle={{
-            background: tooltipBg,
-            border: `1px solid ${tooltipBorder}`,
-            borderRadius: 8,
-            fontSize: 12,
-          }}
+          contentStyle={tooltipStyle}
           formatter={(value: number) => [fmt(value)]}
         />
-        <Legend wrapperStyle={{ fontSize: 12, color: textColor }} />
+        <Legend wrapperStyle={legendStyle} />
         <Bar dataKey="Historical" fill="#2563EB" radius={[3, 3, 0, 0]} maxBarSize={32} />
         <Bar dataKey="Forecast" fill="#F59E0B" radius={[3, 3, 0, 0]} maxBarSize={32} />
       </BarChart>
@@ -1,3 +1,4 @@
+import { useMemo } from 'react'
 import {
   Bar,
   BarChart,
@@ -10,6 +11,7 @@ import {
   YAxis,
 } from 'recharts'
 import { useAppStore } from '../../store/useAppStore'
+import { CHART_PALETTES } from './chartTheme'
 
 const MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
@@ -20,29 +22,33 @@ interface Props {
 
 export default function SeasonalityChart({ monthlyFactors, weeklyPattern }: Props) {
   const theme = useAppStore((s) => s.theme)
-  const gridColor = theme === 'dark' ? '#334155' : '#E2E8F0'
-  const textColor = theme === 'dark' ? '#94A3B8' : '#64748B'
-  const tooltipBg = theme === 'dark' ? '#1E293B' : '#FFFFFF'
-  const tooltipBorder = theme === 'dark' ? '#334155' : '#E2E8F0'
+  const {
+    grid: gridColor,
+    tooltip: tooltipStyle,
+    tick: axisTick,
+  } = CHART_PALETTES[theme]
 
-  const monthData = Object.entries(monthlyFactors)
-    .sort(([a], [b]) => Number(a) - Number(b))
-    .map(([m, factor]) => ({
-      month: MONTH_NAMES[Number(m) - 1] ?? m,
-      factor: Math.round((factor - 1) * 100),
-    }))
-
-  const weekData = weeklyPattern.map((d) => ({
-    day: d.day.slice(0, 3),
-    effect: Math.round(d.effect),
-  }))
+  // Bar rows per seasonality payload: the Analysis page re-renders on every
+  // keystroke in its week inputs, and these props only change with the channel
+  const monthData = useMemo(
+    () =>
+      Object.entries(monthlyFactors)
+        .sort(([a], [b]) => Number(a) - Number(b))
+        .map(([m, factor]) => ({
+          month: MONTH_NAMES[Number(m) - 1] ?? m,
+          factor: Math.round((factor - 1) * 100),
+        })),
+    [monthlyFactors],
+  )
 
-  const tooltipStyle = {
-    background: tooltipBg,
-    border: `1px solid ${tooltipBorder}`,
-    borderRadius: 8,
-    fontSize: 12,
-  }
+  const weekData = useMemo(
+    () =>
+      weeklyPattern.map((d) => ({
+        day: d.day.slice(0, 3),
+        effect: Math.round(d.effect),
+      })),
+    [weeklyPattern],
+  )
 
   return (
     <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
@@ -54,9 +60,9 @@ export default function SeasonalityChart({ monthlyFactors, weeklyPattern }: Prop
         <ResponsiveContainer width="100%" height={240}>
           <BarChart data={monthData} margin={{ top: 5, right: 10, left: 0, bottom: 0 }}>
             <CartesianGrid strokeDasharray="3 3" stroke={gridColor} />
-            <XAxis dataKey="month" tick={{ fontSize: 11, fill: textColor }} />
+            <XAxis dataKey="month" tick={axisTick} />
             <YAxis
-              tick={{ fontSize: 11, fill: textColor }}
+              tick={axisTick}
               tickFormatter={(v: number) => `${v > 0 ? '+' : ''}${v}%`}
               width={52}
             />
@@ -82,9 +88,9 @@ export default function SeasonalityChart({ monthlyFactors, weeklyPattern }: Prop
         <ResponsiveContainer width="100%" height={240}>
           <BarChart data={weekData} margin={{ top: 5, right: 10, left: 0, bottom: 0 }}>
             <CartesianGrid strokeDasharray="3 3" stroke={gridColor} />
-            <XAxis dataKey="day" tick={{ fontSize: 11, fill: textColor }} />
+            <XAxis dataKey="day" tick={axisTick} />
             <YAxis
-              tick={{ fontSize: 11, fill: textColor }}
+              tick={axisTick}
               tickFormatter={(v: number) => `${v > 0 ? '+' : ''}${v}%`}
               width={52}
             />
@@ -0,0 +1,45 @@
+import type { CSSProperties } from 'react'
+
+// Per-theme chart palette — built once at module load instead of on every render
+export interface ChartPalette {
+  grid: string
+  text: string
+  muted: string
+  // Shared <Tooltip contentStyle>: one stable object per theme for every chart
+  tooltip: CSSProperties
+  tooltipLabel: CSSProperties
+  // Axis tick and legend styles, likewise shared so axes see the same props each render
+  tick: AxisTick
+  tickSmall: AxisTick
+  legend: CSSProperties
+}
+
+interface AxisTick {
+  fontSize: number
+  fill: string
+}
+
+const tooltipStyle = (background: string, border: string): CSSProperties => ({
+  background,
+  border: `1px solid ${border}`,
+  borderRadius: 8,
+  fontSize: 12,
+})
+
+const palette = (
+  grid: string, text: string, muted: string, tooltipBg: string,
+): ChartPalette => ({
+  grid,
+  text,
+  muted,
+  tooltip: tooltipStyle(tooltipBg, grid),
+  tooltipLabel: { color: text },
+  tick: { fontSize: 11, fill: text },
+  tickSmall: { fontSize: 10, fill: text },
+  legend: { fontSize: 12, color: text },
+})
+
+export const CHART_PALETTES: Record<'light' | 'dark', ChartPalette> = {
+  light: palette('#E2E8F0', '#64748B', '#94A3B8', '#FFFFFF'),
+  dark: palette('#334155', '#94A3B8', '#64748B', '#1E293B'),
+}
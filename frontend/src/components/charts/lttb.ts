@@ -0,0 +1,42 @@
+// Largest-Triangle-Three-Buckets downsampling, mirroring app/core/downsampling.py.
+// Points are assumed evenly spaced (one per day), so the array index is the x value.
+
+/** Indices of the `nOut` points that best preserve the shape of `ys`; first and last are kept. */
+export function lttbIndices(ys: number[], nOut: number): number[] {
+  const n = ys.length
+  if (nOut >= n || nOut < 3) return ys.map((_, i) => i)
+
+  const bucket = (n - 2) / (nOut - 2)
+  const idx = [0]
+  let a = 0
+  for (let i = 0; i < nOut - 2; i++) {
+    const start = Math.floor(i * bucket) + 1
+    const end = Math.floor((i + 1) * bucket) + 1
+    const nextEnd = Math.min(Math.floor((i + 2) * bucket) + 1, n)
+
+    // Average of the next bucket (the last point when this is the final bucket)
+    let avgX = 0
+    let avgY = 0
+    for (let j = end; j < nextEnd; j++) {
+      avgX += j
+      avgY += ys[j]
+    }
+    const count = nextEnd - end
+    avgX /= count
+    avgY /= count
+
+    let best = start
+    let bestArea = -1
+    for (let j = start; j < end; j++) {
+      const area = Math.abs((a - avgX) * (ys[j] - ys[a]) - (a - j) * (avgY - ys[a]))
+      if (area > bestArea) {
+        bestArea = area
+        best = j
+      }
+    }
+    idx.push(best)
+    a = best
+  }
+  idx.push(n - 1)
+  return idx
+}
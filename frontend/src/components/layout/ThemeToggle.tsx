@@ -2,7 +2,8 @@ import { Moon, Sun } from 'lucide-react'
 import { useAppStore } from '../../store/useAppStore'
 
 export default function ThemeToggle() {
-  const { theme, toggleTheme } = useAppStore()
+  const theme = useAppStore((s) => s.theme)
+  const toggleTheme = useAppStore((s) => s.toggleTheme)
   return (
     <button
       onClick={toggleTheme}
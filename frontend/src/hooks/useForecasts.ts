@@ -1,4 +1,4 @@
-import { useQuery } from '@tanstack/react-query'
+import { keepPreviousData, useQuery } from '@tanstack/react-query'
 import {
   getBacktest,
   getForecast,
@@ -8,6 +8,8 @@ import {
 } from '../api/forecasts'
 import { useAppStore } from '../store/useAppStore'
 
+// Per-channel queries keep showing the previous channel's data while the next
+// one loads, so charts stay mounted and update in place instead of remounting.
 export function useForecast(channel: string | null) {
   const projectId = useAppStore((s) => s.activeProjectId)
   return useQuery({
@@ -15,6 +17,7 @@ export function useForecast(channel: string | null) {
     queryFn: () => getForecast(channel!, projectId),
     enabled: !!channel,
     staleTime: 60_000,
+    placeholderData: keepPreviousData,
   })
 }
 
@@ -25,6 +28,7 @@ export function useMonthlyForecast(channel: string | null) {
     queryFn: () => getMonthlyForecast(channel!, projectId),
     enabled: !!channel,
     staleTime: 60_000,
+    placeholderData: keepPreviousData,
   })
 }
 
@@ -35,6 +39,7 @@ export function useBacktest(channel: string | null) {
     queryFn: () => getBacktest(channel!, projectId),
     enabled: !!channel,
     staleTime: 60_000,
+    placeholderData: keepPreviousData,
   })
 }
 
@@ -45,6 +50,7 @@ export function useSeasonality(channel: string | null) {
     queryFn: () => getSeasonality(channel!, projectId),
     enabled: !!channel,
     staleTime: 60_000,
+    placeholderData: keepPreviousData,
   })
 }
 
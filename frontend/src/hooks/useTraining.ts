@@ -8,10 +8,13 @@ export function useTrainingStatus(jobId: string | null) {
     queryKey: ['training-job', jobId],
     queryFn: () => getJobStatus(jobId!),
     enabled: !!jobId,
+    // Poll every 2 s at first, easing off to 5 s: fits take minutes, so a long
+    // job does not need a status round-trip every two seconds throughout
     refetchInterval: (query) => {
       const data = query.state.data as TrainingJobStatus | undefined
-      if (!data) return 2000
-      return data.status === 'pending' || data.status === 'running' ? 2000 : false
+      const interval = Math.min(2000 + query.state.dataUpdateCount * 250, 5000)
+      if (!data) return interval
+      return data.status === 'pending' || data.status === 'running' ? interval : false
     },
   })
 }
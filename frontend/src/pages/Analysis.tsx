@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react'
+import { useDeferredValue, useEffect, useMemo, useState } from 'react'
 import {
   Bar,
   BarChart,
@@ -60,12 +60,18 @@ function parseWeekInput(val: string): { year: number; week: number } | null {
   return { year: Number(m[1]), week: Number(m[2]) }
 }
 
-/** Returns Mon–Sun Date[] for an ISO year+week. */
-function weekDates(year: number, week: number): Date[] {
+/** Monday (UTC) of an ISO year+week. */
+function weekMonday(year: number, week: number): Date {
   const jan4 = new Date(Date.UTC(year, 0, 4))
   const dow  = (jan4.getUTCDay() + 6) % 7 // 0 = Mon
   const mon  = new Date(jan4)
   mon.setUTCDate(jan4.getUTCDate() - dow + (week - 1) * 7)
+  return mon
+}
+
+/** Returns Mon–Sun Date[] for an ISO year+week. */
+function weekDates(year: number, week: number): Date[] {
+  const mon = weekMonday(year, week)
   return Array.from({ length: 7 }, (_, i) => {
     const d = new Date(mon)
     d.setUTCDate(mon.getUTCDate() + i)
@@ -116,16 +122,28 @@ function buildDailyComparison(
 
 interface WeekRow { week: string; A: number; B: number }
 
+/** Volume totals per week keyed by the week's Monday (YYYY-MM-DD), in one pass over the data. */
+function weeklyTotals(map: Map<string, number>): Map<string, number> {
+  const totals = new Map<string, number>()
+  for (const [date, v] of map) {
+    const d = new Date(`${date}T00:00:00Z`)
+    d.setUTCDate(d.getUTCDate() - ((d.getUTCDay() + 6) % 7))
+    const key = toDateStr(d)
+    totals.set(key, (totals.get(key) ?? 0) + v)
+  }
+  return totals
+}
+
 function buildMultiWeek(
-  map: Map<string, number>,
+  totals: Map<string, number>,
   yearA: number,
   yearB: number,
   weeks: number[],
 ): WeekRow[] {
   return weeks.map((w) => {
     const label  = `W${String(w).padStart(2, '0')}`
-    const totalA = weekDates(yearA, w).reduce((s, d) => s + (map.get(toDateStr(d)) ?? 0), 0)
-    const totalB = weekDates(yearB, w).reduce((s, d) => s + (map.get(toDateStr(d)) ?? 0), 0)
+    const totalA = totals.get(toDateStr(weekMonday(yearA, w))) ?? 0
+    const totalB = totals.get(toDateStr(weekMonday(yearB, w))) ?? 0
     return { week: label, A: Math.round(totalA), B: Math.round(totalB) }
   })
 }
@@ -192,15 +210,14 @@ export default function Analysis() {
 
   // ── Section 1: Single-week comparison ──────────────────────────────────────
   const today = new Date()
-  const defaultWeekA = weekKey(today)
-  const defaultWeekB = (() => {
+
+  // Defaults are only read on mount: lazy initialisers skip the week-key work on later renders
+  const [weekA, setWeekA] = useState(() => weekKey(today))
+  const [weekB, setWeekB] = useState(() => {
     const d = new Date(today)
     d.setFullYear(d.getFullYear() - 1)
     return weekKey(d)
-  })()
-
-  const [weekA, setWeekA] = useState(defaultWeekA)
-  const [weekB, setWeekB] = useState(defaultWeekB)
+  })
 
   const parsedA = useMemo(() => parseWeekInput(weekA), [weekA])
   const parsedB = useMemo(() => parseWeekInput(weekB), [weekB])
@@ -219,8 +236,11 @@ export default function Analysis() {
   const [yearA, setYearA] = useState(today.getFullYear())
   const [yearB, setYearB] = useState(today.getFullYear() - 1)
   const [rangeStart, setRangeStart] = useState(1)
-  const [rangeEnd, setRangeEnd]   = useState(isoWeekNum(today))
+  const [rangeEnd, setRangeEnd]   = useState(() => isoWeekNum(today))
   const [customInput, setCustomInput] = useState('W01-W12')
+  // The chart follows the typed week list at low priority: keystrokes update
+  // the input at once, and the comparison rebuilds when React is idle
+  const deferredCustomInput = useDeferredValue(customInput)
 
   const activeWeeks = useMemo<number[]>(() => {
     if (multiMode === 'range') {
@@ -228,13 +248,17 @@ export default function Analysis() {
       const e = Math.max(s, Math.min(rangeEnd, 53))
       return Array.from({ length: e - s + 1 }, (_, i) => s + i)
     }
-    return parseWeekSet(customInput)
-  }, [multiMode, rangeStart, rangeEnd, customInput])
+    return parseWeekSet(deferredCustomInput)
+  }, [multiMode, rangeStart, rangeEnd, deferredCustomInput])
+
+  // Weekly totals depend only on the data; changing the weeks or years is then
+  // one lookup per week instead of seven date lookups per week and year
+  const weekTotals = useMemo(() => weeklyTotals(allDataMap), [allDataMap])
 
   const multiWeekData = useMemo<WeekRow[]>(() => {
     if (allDataMap.size === 0 || activeWeeks.length === 0) return []
-    return buildMultiWeek(allDataMap, yearA, yearB, activeWeeks)
-  }, [allDataMap, yearA, yearB, activeWeeks])
+    return buildMultiWeek(weekTotals, yearA, yearB, activeWeeks)
+  }, [allDataMap, weekTotals, yearA, yearB, activeWeeks])
 
   const multiTotalA = multiWeekData.reduce((s, r) => s + r.A, 0)
   const multiTotalB = multiWeekData.reduce((s, r) => s + r.B, 0)
@@ -23,7 +23,12 @@ const statusVariant = (s: string) => {
 
 export default function Dashboard() {
   const qc = useQueryClient()
-  const { activeDatasetId, activeJobId, setActiveDatasetId, setActiveJobId, activeProjectId } = useAppStore()
+  // Select only what this page reads, so theme or chart-setting changes don't re-render it
+  const activeDatasetId = useAppStore((s) => s.activeDatasetId)
+  const activeJobId = useAppStore((s) => s.activeJobId)
+  const activeProjectId = useAppStore((s) => s.activeProjectId)
+  const setActiveDatasetId = useAppStore((s) => s.setActiveDatasetId)
+  const setActiveJobId = useAppStore((s) => s.setActiveJobId)
 
   const [selectedChannels, setSelectedChannels] = useState<string[]>([])
   const [monthsAhead, setMonthsAhead] = useState(15)
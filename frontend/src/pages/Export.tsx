@@ -5,10 +5,15 @@ import Button from '../components/ui/Button'
 import { downloadForecasts, downloadIex, downloadReport, downloadSummary } from '../api/forecasts'
 import { useChannels } from '../hooks/useChannels'
 import { useSummary } from '../hooks/useForecasts'
+import { useAppStore } from '../store/useAppStore'
+
+// One shared formatter: toLocaleString(…, options) builds a new Intl.NumberFormat per cell
+const intFmt = new Intl.NumberFormat(undefined, { maximumFractionDigits: 0 })
 
 export default function Export() {
   const { data: summary, isLoading } = useSummary()
   const { data: channels } = useChannels()
+  const projectId = useAppStore((s) => s.activeProjectId)
   const [downloading, setDownloading] = useState<string | null>(null)
 
   // IEX settings
@@ -68,7 +73,7 @@ export default function Export() {
             variant="primary"
             className="w-full justify-center"
             loading={downloading === 'forecasts'}
-            onClick={() => handleDownload('forecasts', downloadForecasts)}
+            onClick={() => handleDownload('forecasts', () => downloadForecasts(undefined, projectId))}
           >
             <Download className="w-4 h-4" /> Download forecasts.xlsx
           </Button>
@@ -232,10 +237,10 @@ export default function Export() {
                   <tr key={row.channel} className="hover:bg-slate-50 dark:hover:bg-slate-800/50">
                     <td className="py-2 pr-4 font-medium">{row.channel}</td>
                     <td className="py-2 px-4 text-right tabular-nums">
-                      {row.hist_avg_daily.toLocaleString(undefined, { maximumFractionDigits: 0 })}
+                      {intFmt.format(row.hist_avg_daily)}
                     </td>
                     <td className="py-2 px-4 text-right tabular-nums">
-                      {row.forecast_avg_daily.toLocaleString(undefined, { maximumFractionDigits: 0 })}
+                      {intFmt.format(row.forecast_avg_daily)}
                     </td>
                     <td
                       className={`py-2 px-4 text-right tabular-nums font-semibold ${
@@ -247,7 +252,7 @@ export default function Export() {
                       {row.change_pct >= 0 ? '+' : ''}{row.change_pct.toFixed(1)}%
                     </td>
                     <td className="py-2 px-4 text-right tabular-nums">
-                      {row.total_15m.toLocaleString(undefined, { maximumFractionDigits: 0 })}
+                      {intFmt.format(row.total_15m)}
                     </td>
                     <td className="py-2 px-4">{row.peak_month}</td>
                     <td className="py-2 px-4">{row.trough_month}</td>
@@ -1,4 +1,4 @@
-import { useRef, useState } from 'react'
+import { useMemo, useRef, useState } from 'react'
 import { useMutation, useQueryClient } from '@tanstack/react-query'
 import { AlertTriangle, Upload, X } from 'lucide-react'
 import {
@@ -16,6 +16,63 @@ import { useAppStore } from '../store/useAppStore'
 const fmt = (n: number) => n.toLocaleString(undefined, { maximumFractionDigits: 0 })
 const fmtHour = (h: number) => h === 0 ? '12AM' : h < 12 ? `${h}AM` : h === 12 ? '12PM' : `${h - 12}PM`
 
+// Owns its own store subscription so dragging a colour picker re-renders only
+// this panel and ForecastChart, not every chart on the page
+function ChartSettingsPanel() {
+  const chartSettings = useAppStore((s) => s.chartSettings)
+  const setChartSettings = useAppStore((s) => s.setChartSettings)
+
+  return (
+    <details className="mt-4">
+      <summary className="text-xs font-medium text-slate-500 dark:text-slate-400 cursor-pointer select-none">
+        Chart Settings
+      </summary>
+      <div className="mt-3 flex flex-wrap gap-4 text-xs text-slate-700 dark:text-slate-300">
+        <label className="flex items-center gap-2">
+          Historical color
+          <input
+            type="color"
+            value={chartSettings.historicalColor}
+            onChange={(e) => setChartSettings({ historicalColor: e.target.value })}
+            className="h-6 w-8 cursor-pointer rounded border border-slate-200 dark:border-slate-600"
+          />
+        </label>
+        <label className="flex items-center gap-2">
+          Forecast color
+          <input
+            type="color"
+            value={chartSettings.forecastColor}
+            onChange={(e) => setChartSettings({ forecastColor: e.target.value })}
+            className="h-6 w-8 cursor-pointer rounded border border-slate-200 dark:border-slate-600"
+          />
+        </label>
+        <label className="flex items-center gap-2 cursor-pointer">
+          <input
+            type="checkbox"
+            checked={chartSettings.showDataLabels}
+            onChange={(e) => setChartSettings({ showDataLabels: e.target.checked })}
+            className="rounded"
+          />
+          Data labels
+        </label>
+        <label className="flex items-center gap-2">
+          Y-axis scale
+          <select
+            value={chartSettings.yAxisScale}
+            onChange={(e) =>
+              setChartSettings({ yAxisScale: e.target.value as 'auto' | 'log' })
+            }
+            className="rounded border border-slate-200 dark:border-slate-600 bg-white dark:bg-slate-800 px-2 py-0.5 text-xs"
+          >
+            <option value="auto">Auto</option>
+            <option value="log">Log</option>
+          </select>
+        </label>
+      </div>
+    </details>
+  )
+}
+
 export default function Forecasts() {
   const qc = useQueryClient()
   const { data: channels } = useChannels()
@@ -25,8 +82,6 @@ export default function Forecasts() {
   const [actualsError, setActualsError] = useState<string | null>(null)
   const actualsInputRef = useRef<HTMLInputElement>(null)
 
-  const chartSettings = useAppStore((s) => s.chartSettings)
-  const setChartSettings = useAppStore((s) => s.setChartSettings)
   const activeProjectId = useAppStore((s) => s.activeProjectId)
 
   const channel = activeChannel ?? channels?.[0]?.name ?? null
@@ -34,10 +89,20 @@ export default function Forecasts() {
 
   const { data: forecast, isLoading: fcLoading } = useForecast(channel)
   const { data: monthly, isLoading: moLoading } = useMonthlyForecast(channel)
-  const { data: backtest } = useBacktest(channel)
+  // The collapsed header only needs the MAPE, which the forecast payload carries;
+  // the per-day holdout series is fetched once the panel is opened
+  const { data: backtest } = useBacktest(backtestOpen ? channel : null)
+  const backtestMape = forecast?.model.backtest_mape ?? null
   const { data: channelObs } = useChannelData(channel)
   const { data: hourlyPattern } = useChannelHourly(isHourly ? channel : null)
 
+  // Bar rows derive straight from the cached per-hour averages; memoised so the
+  // chart gets a stable array instead of a fresh one on every page re-render
+  const hourlyBars = useMemo(
+    () => (hourlyPattern ?? []).map((p) => ({ hour: fmtHour(p.hour), vol: p.avg_volume })),
+    [hourlyPattern],
+  )
+
   // Gap detection
   const todayStr = new Date().toISOString().slice(0, 10)
   const yesterdayStr = new Date(Date.now() - 86400000).toISOString().slice(0, 10)
@@ -172,54 +237,7 @@ export default function Forecasts() {
               </div>
             )}
 
-            {/* Chart settings panel */}
-            <details className="mt-4">
-              <summary className="text-xs font-medium text-slate-500 dark:text-slate-400 cursor-pointer select-none">
-                Chart Settings
-              </summary>
-              <div className="mt-3 flex flex-wrap gap-4 text-xs text-slate-700 dark:text-slate-300">
-                <label className="flex items-center gap-2">
-                  Historical color
-                  <input
-                    type="color"
-                    value={chartSettings.historicalColor}
-                    onChange={(e) => setChartSettings({ historicalColor: e.target.value })}
-                    className="h-6 w-8 cursor-pointer rounded border border-slate-200 dark:border-slate-600"
-                  />
-                </label>
-                <label className="flex items-center gap-2">
-                  Forecast color
-                  <input
-                    type="color"
-                    value={chartSettings.forecastColor}
-                    onChange={(e) => setChartSettings({ forecastColor: e.target.value })}
-                    className="h-6 w-8 cursor-pointer rounded border border-slate-200 dark:border-slate-600"
-                  />
-                </label>
-                <label className="flex items-center gap-2 cursor-pointer">
-                  <input
-                    type="checkbox"
-                    checked={chartSettings.showDataLabels}
-                    onChange={(e) => setChartSettings({ showDataLabels: e.target.checked })}
-                    className="rounded"
-                  />
-                  Data labels
-                </label>
-                <label className="flex items-center gap-2">
-                  Y-axis scale
-                  <select
-                    value={chartSettings.yAxisScale}
-                    onChange={(e) =>
-                      setChartSettings({ yAxisScale: e.target.value as 'auto' | 'log' })
-                    }
-                    className="rounded border border-slate-200 dark:border-slate-600 bg-white dark:bg-slate-800 px-2 py-0.5 text-xs"
-                  >
-                    <option value="auto">Auto</option>
-                    <option value="log">Log</option>
-                  </select>
-                </label>
-              </div>
-            </details>
+            <ChartSettingsPanel />
           </Card>
 
           {/* Monthly chart */}
@@ -249,7 +267,7 @@ export default function Forecasts() {
               </p>
               <ResponsiveContainer width="100%" height={240}>
                 <BarChart
-                  data={hourlyPattern.map((p) => ({ hour: fmtHour(p.hour), vol: p.avg_volume }))}
+                  data={hourlyBars}
                   margin={{ top: 4, right: 16, left: 0, bottom: 0 }}
                 >
                   <CartesianGrid strokeDasharray="3 3" stroke="#E2E8F0" />
@@ -263,7 +281,7 @@ export default function Forecasts() {
           )}
 
           {/* Backtest expander */}
-          {backtest && (
+          {backtestMape !== null && (
             <Card>
               <button
                 onClick={() => setBacktestOpen((o) => !o)}
@@ -273,10 +291,10 @@ export default function Forecasts() {
                   Backtest Results
                 </span>
                 <span className="text-slate-400 dark:text-slate-500 text-sm">
-                  MAPE {backtest.metrics.mape.toFixed(1)}% · {backtestOpen ? '▲' : '▼'}
+                  MAPE {backtestMape.toFixed(1)}% · {backtestOpen ? '▲' : '▼'}
                 </span>
               </button>
-              {backtestOpen && (
+              {backtestOpen && backtest && (
                 <div className="px-5 pb-5">
                   <div className="flex flex-wrap gap-4 mb-4 text-sm text-slate-600 dark:text-slate-400">
                     <span>MAE: <strong>{backtest.metrics.mae.toFixed(0)}</strong></span>
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react'
+import { useMemo, useState } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { Fingerprint, ShieldCheck, ShieldOff, Trash2, UserCheck, UserPlus, UserX, Users } from 'lucide-react'
 import { QRCodeSVG } from 'qrcode.react'
@@ -21,6 +21,11 @@ const COUNTRIES: Record<string, string> = {
   AE: 'United Arab Emirates', SA: 'Saudi Arabia', ZA: 'South Africa',
 }
 
+// Built once: the country <select> re-renders with every keystroke on the page
+const COUNTRY_OPTIONS = Object.entries(COUNTRIES).map(([code, name]) => (
+  <option key={code} value={code}>{name} ({code})</option>
+))
+
 const MONTH_NAMES = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']
 
 export default function Settings() {
@@ -71,19 +76,21 @@ export default function Settings() {
   const currentYear = new Date().getFullYear()
   const [tgtChannel, setTgtChannel] = useState('')
   const [tgtYear, setTgtYear] = useState(currentYear)
-  const [tgtValues, setTgtValues] = useState<Record<string, string>>({})
   const setTargets = useSetTargets()
   const deleteTargets = useDeleteTargets()
 
-  useEffect(() => {
-    if (!tgtChannel || !config) { setTgtValues({}); return }
-    const channelTargets = (config.targets[tgtChannel] ?? {}) as Record<string, number>
+  // The month inputs are uncontrolled: typing re-renders nothing, and the grid
+  // is read once on submit. Saved values seed them via defaultValue, and the
+  // form is re-keyed whenever those seeds change so it picks them up.
+  const tgtDefaults = useMemo(() => {
+    const channelTargets = (config?.targets[tgtChannel] ?? {}) as Record<string, number>
     const populated: Record<string, string> = {}
     for (const [month, vol] of Object.entries(channelTargets)) {
       if (month.startsWith(`${tgtYear}-`)) populated[month] = String(vol)
     }
-    setTgtValues(populated)
+    return populated
   }, [tgtChannel, tgtYear, config])
+  const tgtFormKey = `${tgtChannel}|${tgtYear}|${JSON.stringify(tgtDefaults)}`
 
   const channelNames = channels?.map((c) => c.name) ?? []
 
@@ -214,17 +221,19 @@ export default function Settings() {
     }
   }
 
+  // Saves are skipped when nothing changed: each one is a write plus a config refetch
   const handleSetHoliday = () => {
-    if (!holChannel) return
+    if (!holChannel || config?.holidays[holChannel] === holCountry) return
     setHoliday.mutate({ channel: holChannel, country_code: holCountry })
   }
 
-  const handleSaveTargets = () => {
+  const handleSaveTargets = (e: React.FormEvent<HTMLFormElement>) => {
+    e.preventDefault()
     if (!tgtChannel) return
     const targets: Record<string, number> = {}
-    for (const [month, vol] of Object.entries(tgtValues)) {
+    for (const [month, vol] of new FormData(e.currentTarget)) {
       const n = Number(vol)
-      if (vol !== '' && !isNaN(n) && n > 0) targets[month] = n
+      if (vol !== '' && !isNaN(n) && n > 0 && String(n) !== tgtDefaults[month]) targets[month] = n
     }
     if (Object.keys(targets).length === 0) return
     setTargets.mutate({ channel: tgtChannel, targets })
@@ -530,9 +539,7 @@ export default function Settings() {
           <div className="flex-1 min-w-40">
             <label className="text-xs font-medium text-slate-500 dark:text-slate-400 mb-1 block">Country</label>
             <select value={holCountry} onChange={(e) => setHolCountry(e.target.value)} className={inputCls}>
-              {Object.entries(COUNTRIES).map(([code, name]) => (
-                <option key={code} value={code}>{name} ({code})</option>
-              ))}
+              {COUNTRY_OPTIONS}
             </select>
           </div>
           <Button onClick={handleSetHoliday} loading={setHoliday.isPending} disabled={!holChannel}>Save</Button>
@@ -581,7 +588,7 @@ export default function Settings() {
         </div>
 
         {tgtChannel && (
-          <>
+          <form key={tgtFormKey} onSubmit={handleSaveTargets}>
             <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 gap-3 mb-4">
               {MONTH_NAMES.map((name, i) => {
                 const monthKey = `${tgtYear}-${String(i + 1).padStart(2, '0')}`
@@ -590,18 +597,18 @@ export default function Settings() {
                     <p className="text-xs font-semibold text-slate-500 dark:text-slate-400 mb-1.5">{name}</p>
                     <input
                       type="number" placeholder="—"
-                      value={tgtValues[monthKey] ?? ''}
-                      onChange={(e) => setTgtValues((v) => ({ ...v, [monthKey]: e.target.value }))}
+                      name={monthKey}
+                      defaultValue={tgtDefaults[monthKey] ?? ''}
                       className="w-full rounded border border-slate-200 dark:border-slate-600 bg-white dark:bg-slate-900 text-slate-800 dark:text-slate-200 px-2 py-1 text-sm focus:outline-none focus:ring-2 focus:ring-blue-500"
                     />
                   </div>
                 )
               })}
             </div>
-            <Button onClick={handleSaveTargets} loading={setTargets.isPending} disabled={!tgtChannel}>
+            <Button type="submit" loading={setTargets.isPending} disabled={!tgtChannel}>
               Save targets
             </Button>
-          </>
+          </form>
         )}
 
         {config && Object.keys(config.targets).length > 0 && (
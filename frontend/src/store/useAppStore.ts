@@ -49,3 +49,15 @@ export const useAppStore = create<AppState>()(
     { name: 'forecasting-app' }
   )
 )
+
+// The <html> "dark" class drives every Tailwind dark: style. Flipping it from a
+// store subscription, rather than an effect in <App>, means a theme toggle only
+// re-renders the components that read the theme, not the whole route tree. It
+// is also applied before the first paint, so a persisted dark theme never flashes light.
+const applyTheme = (theme: AppState['theme']) =>
+  document.documentElement.classList.toggle('dark', theme === 'dark')
+
+applyTheme(useAppStore.getState().theme)
+useAppStore.subscribe((s, prev) => {
+  if (s.theme !== prev.theme) applyTheme(s.theme)
+})